@@ -5,17 +5,21 @@ All endpoints needed for 100% Python migration
 
 from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Set, Union
 import jwt
 import bcrypt
 import os
 import json
+import orjson
 from uuid import uuid4
 from enum import Enum
 import asyncio
+import time
+from collections import OrderedDict, deque
+from itertools import islice
 
 # Email service functions (will be imported after app starts)
 email_service = None
@@ -30,11 +34,24 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Runtime environment (read once, does not change while the process runs)
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+
+# Password hashing
+BCRYPT_ROUNDS = 12
+
+# Role hierarchy (lower level = more privileges)
+ROLE_LEVELS = {"admin": 1, "manager": 2, "user": 3, "guest": 4}
+
+# User fields only admins may change through update_user
+ADMIN_ONLY_USER_FIELDS = frozenset({"role"})
+
 # Create FastAPI app
 app = FastAPI(
     title="Plataforma Python Backend - Complete",
     description="Complete Python backend with all endpoints for 100% migration",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Email service functions are implemented as individual helper functions in the HELPER FUNCTIONS section
@@ -52,6 +69,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Pagination cursor for GET /api/v1/logs
 )
 
 # =====================================================================
@@ -176,6 +194,9 @@ class UserApproval(BaseModel):
     assigned_modules: Optional[List[str]] = []
     approval_notes: Optional[str] = None
 
+class UserApprovalBatch(BaseModel):
+    approvals: List[UserApproval]
+
 class UserModulesUpdate(BaseModel):
     assigned_modules: List[str]
     notes: Optional[str] = None
@@ -442,11 +463,11 @@ permissions_db = {
     "perm-8": {"id": "perm-8", "name": "logs.read", "description": "View logs", "resource": "logs", "action": "read", "module": None},
 }
 
-# User permissions mapping
+# User permissions mapping (sets of permission ids)
 user_permissions_db = {
-    "user-1": ["perm-1", "perm-2", "perm-3", "perm-4", "perm-5", "perm-6", "perm-7", "perm-8"],  # Admin - all permissions
-    "user-2": ["perm-1", "perm-4", "perm-6"],  # User - read only
-    "user-3": ["perm-1", "perm-2", "perm-4", "perm-5", "perm-6", "perm-7"],  # Manager - most permissions
+    "user-1": {"perm-1", "perm-2", "perm-3", "perm-4", "perm-5", "perm-6", "perm-7", "perm-8"},  # Admin - all permissions
+    "user-2": {"perm-1", "perm-4", "perm-6"},  # User - read only
+    "user-3": {"perm-1", "perm-2", "perm-4", "perm-5", "perm-6", "perm-7"},  # Manager - most permissions
 }
 
 # Modules database
@@ -498,6 +519,9 @@ modules_db = {
     }
 }
 
+# Valid module references (ids and names); modules are not added or renamed at runtime
+modules_index = set(modules_db) | {m["name"] for m in modules_db.values()}
+
 # Settings database
 settings_db = {
     "set-1": {
@@ -542,11 +566,30 @@ settings_db = {
     }
 }
 
-# Logs database
-logs_db = []
+# Settings indexes {category: [setting, ...]}; the None key holds every setting
+settings_by_category = {}
+public_settings_by_category = {}
+
+# Logs database (bounded ring buffer, oldest entries are dropped)
+MAX_LOGS = 1000
+logs_db = deque(maxlen=MAX_LOGS)
+
+# Activities database (bounded ring buffer, oldest entries are dropped)
+MAX_ACTIVITIES = 100
+activities_db = deque(maxlen=MAX_ACTIVITIES)
+
+# Pending activities, drained into activities_db by a background worker
+MAX_PENDING_ACTIVITIES = 10000
+ACTIVITY_BATCH_SIZE = 100
+activity_queue: Optional[asyncio.Queue] = None
+activity_worker_task: Optional[asyncio.Task] = None
 
-# Activities database
-activities_db = []
+# Outgoing emails, sent by a fixed pool of workers to bound concurrent SMTP work
+MAX_PENDING_EMAILS = 1000
+EMAIL_WORKERS = 8
+email_queue: Optional[asyncio.Queue] = None
+email_worker_tasks: List[asyncio.Task] = []
+email_send_tasks: Set[asyncio.Task] = set()  # Sends started before the workers run
 
 # Notifications database
 notifications_db = {
@@ -586,26 +629,130 @@ notifications_db = {
     ]
 }
 
+# Id index: user id -> email (users_db key), kept in sync on insert/delete
+id_to_email = {u["id"]: email for email, u in users_db.items()}
+
+# Role index: emails of admin users, kept in sync wherever a role changes
+admin_emails = {email for email, u in users_db.items() if u["role"] == "admin"}
+
+# Pending users index: user ids awaiting verification/approval, oldest registration first
+PENDING_STATUSES = frozenset({"pending_email_verification", "pending_admin_approval"})
+pending_user_ids = {
+    u["id"]: None
+    for u in sorted(users_db.values(), key=lambda u: u["registration_date"])
+    if u["status"] in PENDING_STATUSES
+}
+
+# Dashboard aggregates, kept in sync at every mutation point
+_active_user_count = sum(1 for u in users_db.values() if u["is_active"])
+_active_module_count = sum(1 for m in modules_db.values() if m["status"] == "active")
+
+# Dashboard chart data (static sample payload, built once at import time)
+DASHBOARD_CHARTS = {
+    "user_growth": {
+        "labels": ["Jan", "Feb", "Mar", "Apr", "May", "Jun"],
+        "datasets": [{
+            "label": "Users",
+            "data": [10, 15, 22, 28, 35, 42],
+            "backgroundColor": "rgba(99, 102, 241, 0.5)",
+            "borderColor": "rgb(99, 102, 241)"
+        }]
+    },
+    "activity_chart": {
+        "labels": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+        "datasets": [{
+            "label": "Activities",
+            "data": [65, 78, 90, 81, 95, 55, 40],
+            "backgroundColor": "rgba(34, 197, 94, 0.5)",
+            "borderColor": "rgb(34, 197, 94)"
+        }]
+    },
+    "module_usage": {
+        "labels": ["Dashboard", "CRM", "Inventory", "Reports", "Settings"],
+        "datasets": [{
+            "label": "Usage",
+            "data": [300, 250, 180, 120, 90],
+            "backgroundColor": [
+                "rgba(239, 68, 68, 0.5)",
+                "rgba(99, 102, 241, 0.5)",
+                "rgba(34, 197, 94, 0.5)",
+                "rgba(251, 191, 36, 0.5)",
+                "rgba(156, 163, 175, 0.5)"
+            ]
+        }]
+    }
+}
+
+DASHBOARD_CHARTS_JSON = orjson.dumps(DASHBOARD_CHARTS)
+
+# System information (static for the lifetime of the process)
+SYSTEM_INFO = {
+    "version": "2.0.0",
+    "python_version": "3.11+",
+    "framework": "FastAPI",
+    "database": "In-Memory (Mock)",
+    "cache": "In-Memory",
+    "storage": "Local Filesystem",
+    "websocket": "Not Implemented",
+    "email": "Not Configured",
+    "environment": ENVIRONMENT,
+    "uptime": "N/A",
+    "memory_usage": "N/A",
+    "cpu_usage": "N/A"
+}
+
+# Per-user notification counters {user_id: {"total", "unread", "by_type"}}
+notification_stats_db = {}
+
+# Per-user notification index {user_id: {notification_id: notification}}, shares dicts with notifications_db
+notifications_index = {}
+
+# Short-lived results of read-only admin/settings queries {key: (expires_at, result)}
+COALESCE_TTL_SECONDS = 0.1
+MAX_COALESCED_READS = 256
+coalesced_reads = {}
+
+# Last formatted timestamp [epoch millisecond, ISO string], see now_iso()
+iso_timestamp_cache = [0, ""]
+
 # User Sessions Storage
-user_sessions_db = {}  # {user_id: UserSession}
+SESSION_SHARDS = 8
+user_sessions_shards = [{} for _ in range(SESSION_SHARDS)]  # [{user_id: UserSession}, ...]
 
 # Email verification tokens
 email_verification_tokens = {}
 
-# Email verification tokens database
-email_verification_tokens = {}  # {token: {"email": str, "expires_at": datetime, "user_id": str}}
+# Email verification tokens database, in insertion (and therefore expiry) order
+EMAIL_VERIFICATION_TOKEN_TTL_HOURS = 24
+MAX_EMAIL_VERIFICATION_TOKENS = 100000
+email_verification_tokens = OrderedDict()  # {token: {"email": str, "expires_at": datetime, "user_id": str}}
 
 # =====================================================================
 # HELPER FUNCTIONS
 # =====================================================================
 
+def now_iso() -> str:
+    """Current UTC time as an ISO string, formatted at most once per millisecond"""
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != iso_timestamp_cache[0]:
+        iso_timestamp_cache[0] = now_ms
+        iso_timestamp_cache[1] = datetime.utcnow().isoformat() + "Z"
+    return iso_timestamp_cache[1]
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash"""
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 def hash_password(password: str) -> str:
     """Hash a password"""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check if a bcrypt hash was created with a different cost factor"""
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
@@ -677,22 +824,153 @@ def require_role(role: UserRole):
     return role_checker
 
 def log_activity(user_id: str, action: str, resource: str, details: Optional[Dict] = None):
-    """Log user activity"""
+    """Log user activity (queued for the background worker when it is running)"""
     activity = {
-        "id": f"act-{uuid4()}",
+        "id": f"act-{uuid4().hex}",
         "user_id": user_id,
         "user_name": users_db.get(user_id, {}).get("name", "Unknown"),
         "action": action,
         "resource": resource,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": now_iso(),
         "details": details or {}
     }
-    activities_db.append(activity)
-    # Keep only last 100 activities
-    if len(activities_db) > 100:
-        activities_db.pop(0)
+    if activity_queue is None:
+        activities_db.append(activity)
+    else:
+        try:
+            activity_queue.put_nowait(activity)
+        except asyncio.QueueFull:
+            # Drop the entry rather than block the request
+            pass
     return activity
 
+def set_user_active(user: Dict, is_active: bool):
+    """Set user active flag and update the active user counter on transitions"""
+    global _active_user_count
+    if user.get("is_active") != is_active:
+        _active_user_count += 1 if is_active else -1
+    user["is_active"] = is_active
+
+def index_user_role(email: str, role: str):
+    """Keep the admin role index in sync with a user's role"""
+    if role == UserRole.ADMIN:
+        admin_emails.add(email)
+    else:
+        admin_emails.discard(email)
+
+def set_user_status(user: Dict, new_status: str):
+    """Set user status and keep the pending users index in sync"""
+    user["status"] = new_status
+    invalidate_coalesced_reads()
+    if new_status in PENDING_STATUSES:
+        # setdefault keeps the original registration position
+        pending_user_ids.setdefault(user["id"], None)
+    else:
+        pending_user_ids.pop(user["id"], None)
+
+def set_module_status(module: Dict, new_status: str):
+    """Set module status and update the active module counter on transitions"""
+    global _active_module_count
+    was_active = module["status"] == "active"
+    is_active = new_status == "active"
+    if was_active != is_active:
+        _active_module_count += 1 if is_active else -1
+    module["status"] = new_status
+
+def coalesce_read(key: tuple, compute):
+    """Share one computed result among identical reads for COALESCE_TTL_SECONDS"""
+    now = time.monotonic()
+    entry = coalesced_reads.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+    result = compute()
+    if len(coalesced_reads) >= MAX_COALESCED_READS:
+        coalesced_reads.clear()
+    coalesced_reads[key] = (now + COALESCE_TTL_SECONDS, result)
+    return result
+
+def invalidate_coalesced_reads():
+    """Drop coalesced results after a write"""
+    coalesced_reads.clear()
+
+def rebuild_settings_indexes():
+    """Rebuild the per-category settings indexes from settings_db"""
+    settings_by_category.clear()
+    public_settings_by_category.clear()
+    settings_by_category[None] = list(settings_db.values())
+    public_settings_by_category[None] = [s for s in settings_db.values() if s["is_public"]]
+    for setting in settings_db.values():
+        settings_by_category.setdefault(setting["category"], []).append(setting)
+        if setting["is_public"]:
+            public_settings_by_category.setdefault(setting["category"], []).append(setting)
+
+rebuild_settings_indexes()
+
+def session_shard(user_id: str) -> Dict:
+    """Session shard that holds a user's session"""
+    return user_sessions_shards[hash(user_id) % SESSION_SHARDS]
+
+def new_notification_stats() -> Dict[str, Any]:
+    """Empty notification counters"""
+    return {"total": 0, "unread": 0, "by_type": {"info": 0, "warning": 0, "error": 0}}
+
+def track_notification(user_id: str, notification: Dict):
+    """Index a stored notification and count it in the user's counters"""
+    notifications_index.setdefault(user_id, {})[notification["id"]] = notification
+    stats = notification_stats_db.setdefault(user_id, new_notification_stats())
+    stats["total"] += 1
+    if not notification["is_read"]:
+        stats["unread"] += 1
+    if notification["type"] in stats["by_type"]:
+        stats["by_type"][notification["type"]] += 1
+
+def build_notification(user_id: str, title: str, message: str, type_: str = "info",
+                       action_url: Optional[str] = None) -> Dict:
+    """Build an unread notification"""
+    return {
+        "id": f"notif-{uuid4().hex}",
+        "user_id": user_id,
+        "title": title,
+        "message": message,
+        "type": type_,
+        "is_read": False,
+        "action_url": action_url,
+        "created_at": now_iso()
+    }
+
+def add_notification(user_id: str, notification: Dict):
+    """Store a notification for a user and update the counters"""
+    notifications_db.setdefault(user_id, []).append(notification)
+    track_notification(user_id, notification)
+
+# Count the seeded notifications
+for seed_user_id, seed_notifications in notifications_db.items():
+    for seed_notification in seed_notifications:
+        track_notification(seed_user_id, seed_notification)
+
+def queue_email(send_fn, **kwargs):
+    """Queue an email for the email workers"""
+    if not send_fn:
+        # Email service not configured
+        print(f"Email service unavailable, skipping email for {kwargs.get('user_email')}")
+        return
+    name = getattr(send_fn, "__name__", repr(send_fn))
+    if email_queue is None:
+        try:
+            result = send_fn(**kwargs)
+        except Exception as e:
+            print(f"Failed to send email via {name}: {e}")
+            return
+        if asyncio.iscoroutine(result):
+            task = asyncio.create_task(result)
+            email_send_tasks.add(task)
+            task.add_done_callback(email_send_tasks.discard)
+        return
+    try:
+        email_queue.put_nowait((send_fn, kwargs))
+    except asyncio.QueueFull:
+        print(f"Email queue full, dropping {name} for {kwargs.get('user_email')}")
+
 def create_email_verification_token(email: str, user_id: str) -> str:
     """Create email verification token"""
     token = f"verify-{uuid4()}"
@@ -721,23 +999,30 @@ def generate_verification_token() -> str:
     import secrets
     return secrets.token_urlsafe(32)
 
+def purge_expired_verification_tokens():
+    """Drop expired tokens from the front of the store"""
+    # Every token shares the same TTL, so the oldest entries expire first
+    current_time = datetime.utcnow()
+    while email_verification_tokens:
+        oldest = next(iter(email_verification_tokens.values()))
+        if oldest["expires_at"] >= current_time and len(email_verification_tokens) <= MAX_EMAIL_VERIFICATION_TOKENS:
+            break
+        email_verification_tokens.popitem(last=False)
+
 def create_email_verification_token(email: str, user_id: str) -> str:
     """Create and store email verification token"""
     token = generate_verification_token()
-    expires_at = datetime.utcnow() + timedelta(hours=24)  # Token expires in 24 hours
+    created_at = datetime.utcnow()
     
     email_verification_tokens[token] = {
         "email": email,
         "user_id": user_id,
-        "expires_at": expires_at,
-        "created_at": datetime.utcnow()
+        "expires_at": created_at + timedelta(hours=EMAIL_VERIFICATION_TOKEN_TTL_HOURS),
+        "created_at": created_at
     }
     
     # Clean up expired tokens
-    current_time = datetime.utcnow()
-    expired_tokens = [t for t, data in email_verification_tokens.items() if data["expires_at"] < current_time]
-    for expired_token in expired_tokens:
-        del email_verification_tokens[expired_token]
+    purge_expired_verification_tokens()
     
     return token
 
@@ -763,6 +1048,75 @@ def send_verification_email(email: str, token: str):
     print(f"Verification URL: {verification_url}")
     return True
 
+# =====================================================================
+# BACKGROUND WORKERS
+# =====================================================================
+
+async def activity_worker():
+    """Drain queued activities into activities_db in batches"""
+    while True:
+        batch = [await activity_queue.get()]
+        # Take whatever else is already queued, up to the batch size
+        while len(batch) < ACTIVITY_BATCH_SIZE and not activity_queue.empty():
+            batch.append(activity_queue.get_nowait())
+        activities_db.extend(batch)
+        for _ in batch:
+            activity_queue.task_done()
+
+@app.on_event("startup")
+async def start_activity_worker():
+    """Start the activity log worker"""
+    global activity_queue, activity_worker_task
+    activity_queue = asyncio.Queue(maxsize=MAX_PENDING_ACTIVITIES)
+    activity_worker_task = asyncio.create_task(activity_worker())
+
+@app.on_event("shutdown")
+async def stop_activity_worker():
+    """Stop the activity log worker and flush pending activities"""
+    global activity_queue, activity_worker_task
+    if activity_worker_task:
+        activity_worker_task.cancel()
+        try:
+            await activity_worker_task
+        except asyncio.CancelledError:
+            pass
+    while activity_queue and not activity_queue.empty():
+        activities_db.append(activity_queue.get_nowait())
+        activity_queue.task_done()
+    activity_queue = None
+    activity_worker_task = None
+
+async def email_worker():
+    """Send queued emails one at a time"""
+    while True:
+        send_fn, kwargs = await email_queue.get()
+        try:
+            result = send_fn(**kwargs)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            print(f"Failed to send email via {getattr(send_fn, '__name__', repr(send_fn))}: {e}")
+        finally:
+            email_queue.task_done()
+
+@app.on_event("startup")
+async def start_email_workers():
+    """Start the email worker pool"""
+    global email_queue
+    email_queue = asyncio.Queue(maxsize=MAX_PENDING_EMAILS)
+    for _ in range(EMAIL_WORKERS):
+        email_worker_tasks.append(asyncio.create_task(email_worker()))
+
+@app.on_event("shutdown")
+async def stop_email_workers():
+    """Stop the email worker pool"""
+    global email_queue
+    for task in email_worker_tasks:
+        task.cancel()
+    await asyncio.gather(*email_worker_tasks, return_exceptions=True)
+    email_worker_tasks.clear()
+    email_queue = None
+
 # =====================================================================
 # AUTHENTICATION ENDPOINTS
 # =====================================================================
@@ -772,14 +1126,18 @@ async def login(request: LoginRequest):
     """Login endpoint"""
     user = users_db.get(request.email)
     
-    if not user or not verify_password(request.password, user["password"]):
+    if not user or not await asyncio.to_thread(verify_password, request.password, user["password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
+    # Upgrade the stored hash only when the cost factor changed
+    if password_needs_rehash(user["password"]):
+        user["password"] = await asyncio.to_thread(hash_password, request.password)
+    
     # Update last login
-    user["last_login"] = datetime.utcnow().isoformat() + "Z"
+    user["last_login"] = now_iso()
     
     # Create tokens
     access_token = create_access_token(
@@ -878,17 +1236,17 @@ async def register_user(user_registration: UserRegistration):
         "id": user_id,
         "email": user_registration.email,
         "name": user_registration.name,
-        "password": hash_password(user_registration.password),
+        "password": await asyncio.to_thread(hash_password, user_registration.password),
         "role": "user",  # Default role
         "avatar_url": None,
         "phone": user_registration.phone,
         "department": user_registration.department,
         "is_active": False,  # Inactive until approved
         "status": "pending_email_verification",
-        "created_at": datetime.utcnow().isoformat() + "Z",
-        "updated_at": datetime.utcnow().isoformat() + "Z",
+        "created_at": now_iso(),
+        "updated_at": now_iso(),
         "last_login": None,
-        "registration_date": datetime.utcnow().isoformat() + "Z",
+        "registration_date": now_iso(),
         "email_verified": False,
         "admin_approved": False,
         "assigned_modules": [],
@@ -902,7 +1260,10 @@ async def register_user(user_registration: UserRegistration):
     
     # Store user in database
     users_db[user_registration.email] = new_user
-    user_permissions_db[user_id] = []  # No permissions until approved
+    id_to_email[user_id] = user_registration.email
+    set_user_status(new_user, new_user["status"])
+    index_user_role(user_registration.email, new_user["role"])
+    user_permissions_db[user_id] = set()  # No permissions until approved
     
     # Generate and send verification email
     verification_token = create_email_verification_token(user_registration.email, user_id)
@@ -944,8 +1305,8 @@ async def verify_email(token: str):
     
     # Update user status
     user["email_verified"] = True
-    user["status"] = "pending_admin_approval"
-    user["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    set_user_status(user, "pending_admin_approval")
+    user["updated_at"] = now_iso()
     
     # Remove used token
     del email_verification_tokens[token]
@@ -954,23 +1315,15 @@ async def verify_email(token: str):
     log_activity(email, "email_verification", "auth", {"user_id": user_id})
     
     # Create notification for admins about new user pending approval
-    admin_emails = [email for email, u in users_db.items() if u["role"] == "admin"]
     for admin_email in admin_emails:
         admin_user_id = users_db[admin_email]["id"]
-        if admin_user_id not in notifications_db:
-            notifications_db[admin_user_id] = []
-        
-        notification = {
-            "id": f"notif-{uuid4()}",
-            "user_id": admin_user_id,
-            "title": "New User Pending Approval",
-            "message": f"User {user['name']} ({email}) has verified their email and is awaiting admin approval",
-            "type": "info",
-            "is_read": False,
-            "action_url": "/admin/pending-users",
-            "created_at": datetime.utcnow().isoformat() + "Z"
-        }
-        notifications_db[admin_user_id].append(notification)
+        add_notification(admin_user_id, build_notification(
+            admin_user_id,
+            "New User Pending Approval",
+            f"User {user['name']} ({email}) has verified their email and is awaiting admin approval",
+            "info",
+            action_url="/admin/pending-users"
+        ))
     
     return {
         "success": True,
@@ -994,7 +1347,7 @@ async def register_user(user_registration: UserRegistration):
         "id": user_id,
         "email": user_registration.email,
         "name": user_registration.name,
-        "password": hash_password(user_registration.password),
+        "password": await asyncio.to_thread(hash_password, user_registration.password),
         "role": user_registration.role,
         "avatar_url": None,
         "phone": None,
@@ -1003,8 +1356,8 @@ async def register_user(user_registration: UserRegistration):
         "status": "pending",
         "email_verified": False,
         "verification_token": None,
-        "created_at": datetime.utcnow().isoformat() + "Z",
-        "updated_at": datetime.utcnow().isoformat() + "Z",
+        "created_at": now_iso(),
+        "updated_at": now_iso(),
         "last_login": None,
         "bio": None,
         "location": None,
@@ -1014,18 +1367,22 @@ async def register_user(user_registration: UserRegistration):
     }
     
     users_db[user_registration.email] = new_user
-    user_permissions_db[user_id] = []
+    id_to_email[user_id] = user_registration.email
+    set_user_status(new_user, new_user["status"])
+    index_user_role(user_registration.email, new_user["role"])
+    user_permissions_db[user_id] = set()
     
     # Send verification email if requested
     if user_registration.send_verification:
         verification_token = create_email_verification_token(user_registration.email, user_id)
         new_user["verification_token"] = verification_token
         
-        asyncio.create_task(send_verification_email(
+        queue_email(
+            send_verification_email,
             user_email=user_registration.email,
             user_name=user_registration.name,
             verification_token=verification_token
-        ))
+        )
     
     # Log activity
     log_activity(user_registration.email, "user_registration", "auth", {"user_id": user_id})
@@ -1046,11 +1403,7 @@ async def approve_user(
 ):
     """Approve or reject user account (Admin only)"""
     # Find user
-    user_email = None
-    for email, user in users_db.items():
-        if user["id"] == user_id:
-            user_email = email
-            break
+    user_email = id_to_email.get(user_id)
     
     if not user_email:
         raise HTTPException(
@@ -1062,17 +1415,18 @@ async def approve_user(
     
     if approval.approved:
         # Approve user
-        user["status"] = "active"
-        user["is_active"] = True
-        user["updated_at"] = datetime.utcnow().isoformat() + "Z"
+        set_user_status(user, "active")
+        set_user_active(user, True)
+        user["updated_at"] = now_iso()
         
         # Send approval email
-        asyncio.create_task(send_approval_email(
+        queue_email(
+            send_approval_email,
             user_email=user_email,
             user_name=user["name"],
             user_role=user["role"],
             approved_by=current_user["name"]
-        ))
+        )
         
         # Log activity
         log_activity(current_user["email"], "approve_user", "users", {"user_id": user_id})
@@ -1084,17 +1438,18 @@ async def approve_user(
         }
     else:
         # Reject user
-        user["status"] = "rejected"
-        user["is_active"] = False
-        user["updated_at"] = datetime.utcnow().isoformat() + "Z"
+        set_user_status(user, "rejected")
+        set_user_active(user, False)
+        user["updated_at"] = now_iso()
         
         # Send rejection email
-        asyncio.create_task(send_rejection_email(
+        queue_email(
+            send_rejection_email,
             user_email=user_email,
             user_name=user["name"],
             reviewed_by=current_user["name"],
             rejection_reason=approval.rejection_reason
-        ))
+        )
         
         # Log activity
         log_activity(current_user["email"], "reject_user", "users", {
@@ -1125,25 +1480,25 @@ async def get_users(
     authorization: Optional[str] = Depends(require_auth)
 ):
     """Get all users with pagination and filters"""
-    users = []
+    search = search.lower() if search else None
+    
+    # Only touch the filter fields while scanning and stop once the page is full
+    matches = []
     for email, user in users_db.items():
         # Apply filters
         if role and user["role"] != role:
             continue
         if is_active is not None and user["is_active"] != is_active:
             continue
-        if search and search.lower() not in user["name"].lower() and search.lower() not in email.lower():
+        if search and search not in user["name"].lower() and search not in email.lower():
             continue
         
-        # Remove password
-        user_data = {k: v for k, v in user.items() if k != "password"}
-        users.append(user_data)
-    
-    # Apply pagination
-    total = len(users)
-    users = users[skip:skip + limit]
+        matches.append(user)
+        if len(matches) == skip + limit:
+            break
     
-    return users
+    # Apply pagination, copying (without password) only the returned page
+    return [{k: v for k, v in user.items() if k != "password"} for user in matches[skip:]]
 
 @app.get("/api/v1/users/{user_id}", response_model=UserResponse)
 async def get_user(
@@ -1151,15 +1506,15 @@ async def get_user(
     authorization: Optional[str] = Depends(require_auth)
 ):
     """Get user by ID"""
-    for email, user in users_db.items():
-        if user["id"] == user_id:
-            user_data = {k: v for k, v in user.items() if k != "password"}
-            return user_data
+    user_email = id_to_email.get(user_id)
+    if not user_email:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
     
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail="User not found"
-    )
+    user_data = {k: v for k, v in users_db[user_email].items() if k != "password"}
+    return user_data
 
 @app.post("/api/v1/users", response_model=UserResponse)
 async def create_user(
@@ -1167,6 +1522,7 @@ async def create_user(
     current_user: dict = Depends(require_role(UserRole.ADMIN))
 ):
     """Create new user (Admin only)"""
+    global _active_user_count
     # Check if email already exists
     if user_create.email in users_db:
         raise HTTPException(
@@ -1180,14 +1536,14 @@ async def create_user(
         "id": user_id,
         "email": user_create.email,
         "name": user_create.name,
-        "password": hash_password(user_create.password),
+        "password": await asyncio.to_thread(hash_password, user_create.password),
         "role": user_create.role,
         "avatar_url": user_create.avatar_url,
         "phone": user_create.phone,
         "department": user_create.department,
         "is_active": user_create.is_active,
-        "created_at": datetime.utcnow().isoformat() + "Z",
-        "updated_at": datetime.utcnow().isoformat() + "Z",
+        "created_at": now_iso(),
+        "updated_at": now_iso(),
         "last_login": None,
         "bio": None,
         "location": None,
@@ -1197,15 +1553,20 @@ async def create_user(
     }
     
     users_db[user_create.email] = new_user
-    user_permissions_db[user_id] = []
+    id_to_email[user_id] = user_create.email
+    index_user_role(user_create.email, new_user["role"])
+    user_permissions_db[user_id] = set()
+    if new_user["is_active"]:
+        _active_user_count += 1
     
     # Send welcome email if requested
     if user_create.send_welcome_email:
-        asyncio.create_task(send_welcome_email(
+        queue_email(
+            send_welcome_email,
             user_email=user_create.email,
             user_name=user_create.name,
             user_role=user_create.role
-        ))
+        )
     
     # Log activity
     log_activity(current_user["email"], "create_user", "users", {"user_id": user_id})
@@ -1222,11 +1583,7 @@ async def update_user(
 ):
     """Update user"""
     # Find user
-    user_email = None
-    for email, user in users_db.items():
-        if user["id"] == user_id:
-            user_email = email
-            break
+    user_email = id_to_email.get(user_id)
     
     if not user_email:
         raise HTTPException(
@@ -1243,17 +1600,24 @@ async def update_user(
     
     # Update user fields
     user = users_db[user_email]
-    update_data = user_update.dict(exclude_unset=True)
+    update_data = user_update.model_dump(exclude_unset=True, exclude_none=True)
     
     # Don't allow non-admins to change role
-    if "role" in update_data and current_user["role"] != UserRole.ADMIN:
-        del update_data["role"]
+    if current_user["role"] != UserRole.ADMIN:
+        for field in ADMIN_ONLY_USER_FIELDS & update_data.keys():
+            del update_data[field]
     
-    for field, value in update_data.items():
-        if value is not None:
-            user[field] = value
+    is_active = update_data.pop("is_active", None)
+    if is_active is not None:
+        set_user_active(user, is_active)
     
-    user["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    user.update(update_data)
+    
+    if "role" in update_data:
+        index_user_role(user_email, user["role"])
+    
+    user["updated_at"] = now_iso()
+    invalidate_coalesced_reads()
     
     # Log activity
     log_activity(current_user["email"], "update_user", "users", {"user_id": user_id})
@@ -1268,12 +1632,9 @@ async def delete_user(
     current_user: dict = Depends(require_role(UserRole.ADMIN))
 ):
     """Delete user (Admin only)"""
+    global _active_user_count
     # Find and remove user
-    user_email = None
-    for email, user in users_db.items():
-        if user["id"] == user_id:
-            user_email = email
-            break
+    user_email = id_to_email.get(user_id)
     
     if not user_email:
         raise HTTPException(
@@ -1288,7 +1649,13 @@ async def delete_user(
             detail="Cannot delete yourself"
         )
     
+    if users_db[user_email]["is_active"]:
+        _active_user_count -= 1
     del users_db[user_email]
+    del id_to_email[user_id]
+    pending_user_ids.pop(user_id, None)
+    invalidate_coalesced_reads()
+    admin_emails.discard(user_email)
     if user_id in user_permissions_db:
         del user_permissions_db[user_id]
     
@@ -1312,18 +1679,17 @@ async def change_password(
         )
     
     # Verify current password
-    if not verify_password(password_change.current_password, current_user["password"]):
+    if not await asyncio.to_thread(verify_password, password_change.current_password, current_user["password"]):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
     # Update password
-    for email, user in users_db.items():
-        if user["id"] == user_id:
-            user["password"] = hash_password(password_change.new_password)
-            user["updated_at"] = datetime.utcnow().isoformat() + "Z"
-            break
+    new_password_hash = await asyncio.to_thread(hash_password, password_change.new_password)
+    user = users_db[id_to_email[user_id]]
+    user["password"] = new_password_hash
+    user["updated_at"] = now_iso()
     
     # Log activity
     log_activity(current_user["email"], "change_password", "users")
@@ -1348,24 +1714,23 @@ async def get_my_permissions(
 ):
     """Get current user's permissions"""
     user_id = current_user["id"]
-    permission_ids = user_permissions_db.get(user_id, [])
+    permission_ids = user_permissions_db.get(user_id, set())
     
-    permissions = []
-    for perm_id in permission_ids:
-        if perm_id in permissions_db:
-            perm = permissions_db[perm_id]
-            if module is None or perm["module"] == module:
-                permissions.append(perm)
+    # Walk the catalog so the response order is stable
+    permissions = [
+        perm for perm_id, perm in permissions_db.items()
+        if perm_id in permission_ids and (module is None or perm["module"] == module)
+    ]
     
     # Get role info
     role = current_user["role"]
-    role_levels = {"admin": 1, "manager": 2, "user": 3, "guest": 4}
+    level = ROLE_LEVELS.get(role, 4)
     
     return {
         "user_id": user_id,
         "permissions": permissions,
-        "roles": [{"name": role, "level": role_levels.get(role, 4)}],
-        "max_level": role_levels.get(role, 4)
+        "roles": [{"name": role, "level": level}],
+        "max_level": level
     }
 
 @app.post("/api/v1/permissions/assign")
@@ -1374,12 +1739,9 @@ async def assign_permissions(
     current_user: dict = Depends(require_role(UserRole.ADMIN))
 ):
     """Assign permissions to user (Admin only)"""
-    if assign.user_id not in user_permissions_db:
-        user_permissions_db[assign.user_id] = []
-    
-    for perm_id in assign.permission_ids:
-        if perm_id in permissions_db and perm_id not in user_permissions_db[assign.user_id]:
-            user_permissions_db[assign.user_id].append(perm_id)
+    user_permissions_db.setdefault(assign.user_id, set()).update(
+        perm_id for perm_id in assign.permission_ids if perm_id in permissions_db
+    )
     
     # Log activity
     log_activity(current_user["email"], "assign_permissions", "permissions", 
@@ -1395,9 +1757,7 @@ async def revoke_permissions(
 ):
     """Revoke permissions from user (Admin only)"""
     if user_id in user_permissions_db:
-        for perm_id in permission_ids:
-            if perm_id in user_permissions_db[user_id]:
-                user_permissions_db[user_id].remove(perm_id)
+        user_permissions_db[user_id].difference_update(permission_ids)
     
     # Log activity
     log_activity(current_user["email"], "revoke_permissions", "permissions",
@@ -1414,14 +1774,11 @@ async def get_dashboard_stats(
     current_user: dict = Depends(require_auth)
 ):
     """Get dashboard statistics"""
-    active_users = sum(1 for u in users_db.values() if u["is_active"])
-    active_modules = sum(1 for m in modules_db.values() if m["status"] == "active")
-    
     return {
         "total_users": len(users_db),
-        "active_users": active_users,
+        "active_users": _active_user_count,
         "total_modules": len(modules_db),
-        "active_modules": active_modules,
+        "active_modules": _active_module_count,
         "total_logs": len(logs_db),
         "system_health": 98.5,
         "storage_used": 45.2,
@@ -1433,41 +1790,7 @@ async def get_dashboard_charts(
     current_user: dict = Depends(require_auth)
 ):
     """Get dashboard chart data"""
-    # Generate sample chart data
-    return {
-        "user_growth": {
-            "labels": ["Jan", "Feb", "Mar", "Apr", "May", "Jun"],
-            "datasets": [{
-                "label": "Users",
-                "data": [10, 15, 22, 28, 35, 42],
-                "backgroundColor": "rgba(99, 102, 241, 0.5)",
-                "borderColor": "rgb(99, 102, 241)"
-            }]
-        },
-        "activity_chart": {
-            "labels": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
-            "datasets": [{
-                "label": "Activities",
-                "data": [65, 78, 90, 81, 95, 55, 40],
-                "backgroundColor": "rgba(34, 197, 94, 0.5)",
-                "borderColor": "rgb(34, 197, 94)"
-            }]
-        },
-        "module_usage": {
-            "labels": ["Dashboard", "CRM", "Inventory", "Reports", "Settings"],
-            "datasets": [{
-                "label": "Usage",
-                "data": [300, 250, 180, 120, 90],
-                "backgroundColor": [
-                    "rgba(239, 68, 68, 0.5)",
-                    "rgba(99, 102, 241, 0.5)",
-                    "rgba(34, 197, 94, 0.5)",
-                    "rgba(251, 191, 36, 0.5)",
-                    "rgba(156, 163, 175, 0.5)"
-                ]
-            }]
-        }
-    }
+    return Response(content=DASHBOARD_CHARTS_JSON, media_type="application/json")
 
 @app.get("/api/v1/dashboard/activities", response_model=List[Activity])
 async def get_dashboard_activities(
@@ -1476,7 +1799,7 @@ async def get_dashboard_activities(
 ):
     """Get recent activities"""
     # Return last N activities
-    return activities_db[-limit:] if activities_db else []
+    return list(islice(activities_db, max(0, len(activities_db) - limit), None))
 
 # =====================================================================
 # MODULE ENDPOINTS
@@ -1529,8 +1852,8 @@ async def install_module(
         )
     
     # Update module status
-    module["status"] = "active"
-    module["installed_at"] = datetime.utcnow().isoformat() + "Z"
+    set_module_status(module, "active")
+    module["installed_at"] = now_iso()
     module["config"].update(install.config)
     
     # Log activity
@@ -1551,7 +1874,7 @@ async def uninstall_module(
         )
     
     module = modules_db[module_id]
-    module["status"] = "inactive"
+    set_module_status(module, "inactive")
     
     # Log activity
     log_activity(current_user["email"], "uninstall_module", "modules", {"module_id": module_id})
@@ -1577,27 +1900,27 @@ async def update_profile(
 ):
     """Update current user's profile"""
     # Find user in database
-    for email, user in users_db.items():
-        if user["id"] == current_user["id"]:
-            # Update profile fields
-            update_data = profile_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                if value is not None:
-                    user[field] = value
-            
-            user["updated_at"] = datetime.utcnow().isoformat() + "Z"
-            
-            # Log activity
-            log_activity(current_user["email"], "update_profile", "profile")
-            
-            # Return updated profile
-            profile = {k: v for k, v in user.items() if k != "password"}
-            return profile
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail="User not found"
-    )
+    user_email = id_to_email.get(current_user["id"])
+    if not user_email:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    user = users_db[user_email]
+    
+    # Update profile fields
+    user.update(profile_update.model_dump(exclude_unset=True, exclude_none=True))
+    
+    user["updated_at"] = now_iso()
+    invalidate_coalesced_reads()
+    
+    # Log activity
+    log_activity(current_user["email"], "update_profile", "profile")
+    
+    # Return updated profile
+    profile = {k: v for k, v in user.items() if k != "password"}
+    return profile
 
 @app.post("/api/v1/profile/avatar")
 async def upload_avatar(
@@ -1616,11 +1939,12 @@ async def upload_avatar(
     file_path = f"/uploads/avatars/{current_user['id']}-{file.filename}"
     
     # Update user avatar URL
-    for email, user in users_db.items():
-        if user["id"] == current_user["id"]:
-            user["avatar_url"] = file_path
-            user["updated_at"] = datetime.utcnow().isoformat() + "Z"
-            break
+    user_email = id_to_email.get(current_user["id"])
+    if user_email:
+        user = users_db[user_email]
+        user["avatar_url"] = file_path
+        user["updated_at"] = now_iso()
+        invalidate_coalesced_reads()
     
     # Log activity
     log_activity(current_user["email"], "upload_avatar", "profile")
@@ -1637,16 +1961,12 @@ async def get_settings(
     current_user: dict = Depends(require_auth)
 ):
     """Get settings"""
-    settings = []
-    for setting in settings_db.values():
-        # Non-admins can only see public settings
-        if current_user["role"] != UserRole.ADMIN and not setting["is_public"]:
-            continue
-        
-        if category is None or setting["category"] == category:
-            settings.append(setting)
-    
-    return settings
+    # Non-admins can only see public settings
+    if current_user["role"] == UserRole.ADMIN:
+        index = settings_by_category
+    else:
+        index = public_settings_by_category
+    return index.get(category, [])
 
 @app.put("/api/v1/settings")
 async def update_settings(
@@ -1661,10 +1981,12 @@ async def update_settings(
         if setting_id and setting_id in settings_db:
             setting = settings_db[setting_id]
             setting["value"] = setting_data.get("value", setting["value"])
-            setting["updated_at"] = datetime.utcnow().isoformat() + "Z"
+            setting["updated_at"] = now_iso()
             setting["updated_by"] = current_user["id"]
             updated.append(setting_id)
     
+    rebuild_settings_indexes()
+    
     # Log activity
     log_activity(current_user["email"], "update_settings", "settings", {"updated": updated})
     
@@ -1676,23 +1998,37 @@ async def update_settings(
 
 @app.get("/api/v1/logs", response_model=List[LogEntry])
 async def get_logs(
+    response: Response,
     level: Optional[LogLevel] = None,
     source: Optional[str] = None,
     limit: int = Query(50, ge=1, le=500),
+    before: Optional[str] = Query(None, description="Only return logs older than this log id"),
     current_user: dict = Depends(require_auth)
 ):
-    """Get system logs"""
-    # Filter logs
-    filtered_logs = []
-    for log in logs_db:
-        if level and log["level"] != level:
-            continue
-        if source and log["source"] != source:
-            continue
-        filtered_logs.append(log)
-    
-    # Return last N logs
-    return filtered_logs[-limit:]
+    """Get system logs (the X-Next-Cursor header holds the cursor for the next page)"""
+    # Walk from the newest log and stop once the page is full
+    logs = reversed(logs_db)
+    if before is not None:
+        # Skip up to and including the cursor entry
+        for log in logs:
+            if log["id"] == before:
+                break
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unknown or expired log cursor; restart from the newest logs"
+            )
+    if level:
+        logs = filter(lambda log: log["level"] == level, logs)
+    if source:
+        logs = filter(lambda log: log["source"] == source, logs)
+    page = list(islice(logs, limit))
+    if len(page) == limit:
+        response.headers["X-Next-Cursor"] = page[-1]["id"]
+    
+    # Return last N logs in chronological order
+    page.reverse()
+    return page
 
 @app.post("/api/v1/logs", response_model=LogEntry)
 async def create_log(
@@ -1701,21 +2037,17 @@ async def create_log(
 ):
     """Create log entry"""
     log_entry = {
-        "id": f"log-{uuid4()}",
+        "id": f"log-{uuid4().hex}",
         "level": log_create.level,
         "message": log_create.message,
         "source": log_create.source,
         "user_id": current_user["id"],
         "metadata": log_create.metadata or {},
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": now_iso()
     }
     
     logs_db.append(log_entry)
     
-    # Keep only last 1000 logs
-    if len(logs_db) > 1000:
-        logs_db.pop(0)
-    
     return log_entry
 
 # =====================================================================
@@ -1741,35 +2073,24 @@ async def mark_notification_read(
     current_user: dict = Depends(require_auth)
 ):
     """Mark notification as read"""
-    user_notifications = notifications_db.get(current_user["id"], [])
-    
-    for notif in user_notifications:
-        if notif["id"] == notification_id:
-            notif["is_read"] = True
-            return {"success": True, "message": "Notification marked as read"}
+    notif = notifications_index.get(current_user["id"], {}).get(notification_id)
+    if not notif:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notification not found"
+        )
     
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail="Notification not found"
-    )
+    if not notif["is_read"]:
+        notif["is_read"] = True
+        notification_stats_db[current_user["id"]]["unread"] -= 1
+    return {"success": True, "message": "Notification marked as read"}
 
 @app.get("/api/v1/notifications/stats")
 async def get_notification_stats(
     current_user: dict = Depends(require_auth)
 ):
     """Get notification statistics"""
-    user_notifications = notifications_db.get(current_user["id"], [])
-    unread = sum(1 for n in user_notifications if not n["is_read"])
-    
-    return {
-        "total": len(user_notifications),
-        "unread": unread,
-        "by_type": {
-            "info": sum(1 for n in user_notifications if n["type"] == "info"),
-            "warning": sum(1 for n in user_notifications if n["type"] == "warning"),
-            "error": sum(1 for n in user_notifications if n["type"] == "error")
-        }
-    }
+    return notification_stats_db.get(current_user["id"]) or new_notification_stats()
 
 # =====================================================================
 # ADMIN USER MANAGEMENT ENDPOINTS
@@ -1780,17 +2101,69 @@ async def get_pending_users(
     current_user: dict = Depends(require_role(UserRole.ADMIN))
 ):
     """Get all users pending approval (Admin only)"""
-    pending_users = []
-    
-    for email, user in users_db.items():
-        if user["status"] in ["pending_email_verification", "pending_admin_approval"]:
-            user_data = {k: v for k, v in user.items() if k != "password"}
-            pending_users.append(user_data)
-    
-    # Sort by registration date (newest first)
-    pending_users.sort(key=lambda x: x["registration_date"], reverse=True)
-    
-    return pending_users
+    def compute():
+        # The index is kept in registration order, so reversing gives newest first
+        pending_users = []
+        for user_id in reversed(pending_user_ids):
+            user = users_db[id_to_email[user_id]]
+            pending_users.append({k: v for k, v in user.items() if k != "password"})
+        return pending_users
+    
+    return coalesce_read(("pending_users",), compute)
+
+def apply_user_approval(user_id: str, user: Dict, approval: UserApproval) -> Dict:
+    """Apply an approve/reject decision to a pending user and notify them"""
+    if approval.approved:
+        # Approve user
+        user["admin_approved"] = True
+        set_user_active(user, True)
+        set_user_status(user, "active")
+        user["assigned_modules"] = approval.assigned_modules or ["dashboard"]  # Default to dashboard
+        user["approval_notes"] = approval.approval_notes
+        user["updated_at"] = now_iso()
+        
+        # Assign basic permissions based on assigned modules
+        # Give basic read permissions
+        basic_permissions = {"perm-1", "perm-4", "perm-6"}  # users.read, modules.read, settings.read
+        user_permissions_db.setdefault(user_id, set()).update(basic_permissions)
+        
+        # Create welcome notification for the user
+        add_notification(user_id, build_notification(
+            user_id,
+            "Account Approved!",
+            f"Welcome to the platform! Your account has been approved and you now have access to: {', '.join(approval.assigned_modules or ['Dashboard'])}",
+            "info",
+            action_url="/dashboard"
+        ))
+        
+        return {
+            "success": True,
+            "message": f"User {user['name']} has been approved successfully",
+            "user_status": "active",
+            "assigned_modules": approval.assigned_modules
+        }
+    else:
+        # Reject user
+        user["admin_approved"] = False
+        set_user_active(user, False)
+        set_user_status(user, "rejected")
+        user["approval_notes"] = approval.approval_notes
+        user["updated_at"] = now_iso()
+        
+        # Create rejection notification for the user
+        add_notification(user_id, build_notification(
+            user_id,
+            "Account Application Rejected",
+            f"Unfortunately, your account application has been rejected. Reason: {approval.approval_notes or 'No reason provided'}",
+            "warning",
+            action_url=None
+        ))
+        
+        return {
+            "success": True,
+            "message": f"User {user['name']} has been rejected",
+            "user_status": "rejected"
+        }
 
 @app.post("/api/v1/admin/approve-user/{user_id}")
 async def approve_user(
@@ -1806,11 +2179,7 @@ async def approve_user(
         )
     
     # Find user
-    user_email = None
-    for email, user in users_db.items():
-        if user["id"] == user_id:
-            user_email = email
-            break
+    user_email = id_to_email.get(user_id)
     
     if not user_email:
         raise HTTPException(
@@ -1833,89 +2202,69 @@ async def approve_user(
             detail="User email must be verified before approval"
         )
     
+    result = apply_user_approval(user_id, user, approval)
+    
+    # Log activity
     if approval.approved:
-        # Approve user
-        user["admin_approved"] = True
-        user["is_active"] = True
-        user["status"] = "active"
-        user["assigned_modules"] = approval.assigned_modules or ["dashboard"]  # Default to dashboard
-        user["approval_notes"] = approval.approval_notes
-        user["updated_at"] = datetime.utcnow().isoformat() + "Z"
-        
-        # Assign basic permissions based on assigned modules
-        if user_id not in user_permissions_db:
-            user_permissions_db[user_id] = []
-        
-        # Give basic read permissions
-        basic_permissions = ["perm-1", "perm-4", "perm-6"]  # users.read, modules.read, settings.read
-        for perm in basic_permissions:
-            if perm not in user_permissions_db[user_id]:
-                user_permissions_db[user_id].append(perm)
-        
-        # Create welcome notification for the user
-        if user_id not in notifications_db:
-            notifications_db[user_id] = []
-        
-        welcome_notification = {
-            "id": f"notif-{uuid4()}",
-            "user_id": user_id,
-            "title": "Account Approved!",
-            "message": f"Welcome to the platform! Your account has been approved and you now have access to: {', '.join(approval.assigned_modules or ['Dashboard'])}",
-            "type": "info",
-            "is_read": False,
-            "action_url": "/dashboard",
-            "created_at": datetime.utcnow().isoformat() + "Z"
-        }
-        notifications_db[user_id].append(welcome_notification)
-        
-        # Log activity
         log_activity(current_user["email"], "approve_user", "admin", {
             "approved_user_id": user_id,
             "assigned_modules": approval.assigned_modules,
             "notes": approval.approval_notes
         })
-        
-        return {
-            "success": True,
-            "message": f"User {user['name']} has been approved successfully",
-            "user_status": "active",
-            "assigned_modules": approval.assigned_modules
-        }
     else:
-        # Reject user
-        user["admin_approved"] = False
-        user["is_active"] = False
-        user["status"] = "rejected"
-        user["approval_notes"] = approval.approval_notes
-        user["updated_at"] = datetime.utcnow().isoformat() + "Z"
-        
-        # Create rejection notification for the user
-        if user_id not in notifications_db:
-            notifications_db[user_id] = []
-        
-        rejection_notification = {
-            "id": f"notif-{uuid4()}",
-            "user_id": user_id,
-            "title": "Account Application Rejected",
-            "message": f"Unfortunately, your account application has been rejected. Reason: {approval.approval_notes or 'No reason provided'}",
-            "type": "warning",
-            "is_read": False,
-            "action_url": None,
-            "created_at": datetime.utcnow().isoformat() + "Z"
-        }
-        notifications_db[user_id].append(rejection_notification)
-        
-        # Log activity
         log_activity(current_user["email"], "reject_user", "admin", {
             "rejected_user_id": user_id,
             "notes": approval.approval_notes
         })
+    
+    return result
+
+@app.post("/api/v1/admin/approve-users")
+async def approve_users(
+    batch: UserApprovalBatch,
+    current_user: dict = Depends(require_role(UserRole.ADMIN))
+):
+    """Approve or reject several user registrations in one call (Admin only)"""
+    results = []
+    approved_ids = []
+    rejected_ids = []
+    
+    for approval in batch.approvals:
+        user_email = id_to_email.get(approval.user_id)
+        user = users_db[user_email] if user_email else None
         
-        return {
-            "success": True,
-            "message": f"User {user['name']} has been rejected",
-            "user_status": "rejected"
-        }
+        if not user:
+            error = "User not found"
+        elif user["status"] != "pending_admin_approval":
+            error = "User is not pending approval"
+        elif not user["email_verified"]:
+            error = "User email must be verified before approval"
+        else:
+            error = None
+        
+        if error:
+            results.append({"user_id": approval.user_id, "success": False, "message": error})
+            continue
+        
+        result = apply_user_approval(approval.user_id, user, approval)
+        results.append({"user_id": approval.user_id, **result})
+        if approval.approved:
+            approved_ids.append(approval.user_id)
+        else:
+            rejected_ids.append(approval.user_id)
+    
+    # Log one activity for the whole batch
+    log_activity(current_user["email"], "approve_users", "admin", {
+        "count": len(approved_ids) + len(rejected_ids),
+        "approved_user_ids": approved_ids,
+        "rejected_user_ids": rejected_ids
+    })
+    
+    return {
+        "success": True,
+        "processed": len(approved_ids) + len(rejected_ids),
+        "results": results
+    }
 
 @app.put("/api/v1/admin/user-modules/{user_id}")
 async def update_user_modules(
@@ -1925,11 +2274,7 @@ async def update_user_modules(
 ):
     """Update user's assigned modules (Admin only)"""
     # Find user
-    user_email = None
-    for email, user in users_db.items():
-        if user["id"] == user_id:
-            user_email = email
-            break
+    user_email = id_to_email.get(user_id)
     
     if not user_email:
         raise HTTPException(
@@ -1947,11 +2292,8 @@ async def update_user_modules(
         )
     
     # Validate module IDs (check if they exist)
-    available_modules = list(modules_db.keys())
-    module_names = [mod["name"] for mod in modules_db.values()]
-    
     for module in modules_update.assigned_modules:
-        if module not in available_modules and module not in module_names:
+        if module not in modules_index:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Module '{module}' does not exist"
@@ -1959,26 +2301,19 @@ async def update_user_modules(
     
     # Update user's assigned modules
     user["assigned_modules"] = modules_update.assigned_modules
-    user["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    user["updated_at"] = now_iso()
     
     if modules_update.notes:
         user["approval_notes"] = modules_update.notes
     
     # Create notification for the user about module changes
-    if user_id not in notifications_db:
-        notifications_db[user_id] = []
-    
-    module_notification = {
-        "id": f"notif-{uuid4()}",
-        "user_id": user_id,
-        "title": "Module Access Updated",
-        "message": f"Your module access has been updated. You now have access to: {', '.join(modules_update.assigned_modules)}",
-        "type": "info",
-        "is_read": False,
-        "action_url": "/dashboard",
-        "created_at": datetime.utcnow().isoformat() + "Z"
-    }
-    notifications_db[user_id].append(module_notification)
+    add_notification(user_id, build_notification(
+        user_id,
+        "Module Access Updated",
+        f"Your module access has been updated. You now have access to: {', '.join(modules_update.assigned_modules)}",
+        "info",
+        action_url="/dashboard"
+    ))
     
     # Log activity
     log_activity(current_user["email"], "update_user_modules", "admin", {
@@ -1997,65 +2332,61 @@ async def update_user_modules(
 # HEALTH & STATUS ENDPOINTS
 # =====================================================================
 
+def json_response_with_prefix(prefix: bytes, dynamic: Dict) -> Response:
+    """Append dynamic fields to a pre-serialized JSON object prefix"""
+    return Response(content=prefix + b"," + orjson.dumps(dynamic)[1:], media_type="application/json")
+
+# Static parts of the root/health payloads, serialized without the closing brace
+ROOT_JSON_PREFIX = orjson.dumps({
+    "message": "Python FastAPI Backend - Complete Version",
+    "status": "online",
+    "version": "2.0.0",
+    "endpoints": {
+        "auth": "/api/v1/auth",
+        "users": "/api/v1/users",
+        "permissions": "/api/v1/permissions",
+        "dashboard": "/api/v1/dashboard",
+        "modules": "/api/v1/modules",
+        "profile": "/api/v1/profile",
+        "settings": "/api/v1/settings",
+        "logs": "/api/v1/logs",
+        "notifications": "/api/v1/notifications",
+        "admin": "/api/v1/admin",
+        "sessions": "/api/users/{user_id}/session"
+    },
+    "documentation": "/docs"
+})[:-1]
+
+HEALTH_JSON_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "service": "plataforma-python-backend-complete",
+    "version": "2.0.0"
+})[:-1]
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Python FastAPI Backend - Complete Version",
-        "status": "online",
-        "version": "2.0.0",
-        "endpoints": {
-            "auth": "/api/v1/auth",
-            "users": "/api/v1/users",
-            "permissions": "/api/v1/permissions",
-            "dashboard": "/api/v1/dashboard",
-            "modules": "/api/v1/modules",
-            "profile": "/api/v1/profile",
-            "settings": "/api/v1/settings",
-            "logs": "/api/v1/logs",
-            "notifications": "/api/v1/notifications",
-            "admin": "/api/v1/admin",
-            "sessions": "/api/users/{user_id}/session"
-        },
-        "documentation": "/docs",
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
+    return json_response_with_prefix(ROOT_JSON_PREFIX, {"timestamp": now_iso()})
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "plataforma-python-backend-complete",
-        "version": "2.0.0",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+    return json_response_with_prefix(HEALTH_JSON_PREFIX, {
+        "timestamp": now_iso(),
         "stats": {
             "users": len(users_db),
             "modules": len(modules_db),
             "activities": len(activities_db),
             "logs": len(logs_db)
         }
-    }
+    })
 
 @app.get("/api/v1/system/info")
 async def system_info(
     current_user: dict = Depends(require_role(UserRole.ADMIN))
 ):
     """Get system information (Admin only)"""
-    return {
-        "version": "2.0.0",
-        "python_version": "3.11+",
-        "framework": "FastAPI",
-        "database": "In-Memory (Mock)",
-        "cache": "In-Memory",
-        "storage": "Local Filesystem",
-        "websocket": "Not Implemented",
-        "email": "Not Configured",
-        "environment": os.getenv("ENVIRONMENT", "development"),
-        "uptime": "N/A",
-        "memory_usage": "N/A",
-        "cpu_usage": "N/A"
-    }
+    return SYSTEM_INFO
 
 # =====================================================================
 # SESSION MANAGEMENT ENDPOINTS - User Session Persistence
@@ -2080,16 +2411,17 @@ async def get_user_session(
             detail="Can only access your own session data"
         )
     
-    session_data = user_sessions_db.get(user_id)
+    session_data = session_shard(user_id).get(user_id)
     if not session_data:
         return {"success": False, "data": None}
     
     log_activity(current_user["email"], f"session_load", "session")
     
-    return {
+    # Session payloads carry full window state, so skip jsonable_encoder
+    return ORJSONResponse({
         "success": True,
         "data": session_data
-    }
+    })
 
 @app.post("/api/users/{user_id}/session")
 async def save_user_session(
@@ -2119,7 +2451,7 @@ async def save_user_session(
         )
     
     # Store session data
-    user_sessions_db[user_id] = session_data.dict()
+    session_shard(user_id)[user_id] = session_data.model_dump()
     
     log_activity(current_user["email"], f"session_save", "session")
     
@@ -2144,22 +2476,20 @@ async def delete_user_session(
             detail="Can only delete your own session data"
         )
     
-    if user_id in user_sessions_db:
-        del user_sessions_db[user_id]
+    shard = session_shard(user_id)
+    if user_id in shard:
+        del shard[user_id]
         log_activity(current_user["email"], f"session_delete", "session")
         return {"success": True, "message": "Session deleted successfully"}
     
     return {"success": False, "message": "No session found to delete"}
 
-@app.get("/api/v1/admin/sessions")
-async def get_all_sessions(
-    current_user: dict = Depends(require_role(UserRole.ADMIN))
-):
-    """Get all user sessions (Admin only)"""
+def build_session_shard_view(shard: Dict) -> List[Dict]:
+    """Summarize the sessions stored in one shard"""
     sessions = []
-    for user_id, session_data in user_sessions_db.items():
+    for user_id, session_data in shard.items():
         # Get user info for context
-        user_email = next((email for email, user in users_db.items() if user["id"] == user_id), "Unknown")
+        user_email = id_to_email.get(user_id, "Unknown")
         sessions.append({
             "userId": user_id,
             "userEmail": user_email,
@@ -2169,12 +2499,27 @@ async def get_all_sessions(
             "windowsCount": len(session_data.get("windowsState", [])),
             "lastUpdated": session_data.get("metadata", {}).get("updatedAt", 0)
         })
+    return sessions
+
+@app.get("/api/v1/admin/sessions")
+async def get_all_sessions(
+    current_user: dict = Depends(require_role(UserRole.ADMIN))
+):
+    """Get all user sessions (Admin only)"""
+    sessions = [
+        session
+        for shard in user_sessions_shards
+        for session in build_session_shard_view(shard)
+    ]
+    # Shard placement uses the per-process salted hash(); sort for a stable order
+    sessions.sort(key=lambda session: session["userId"])
     
-    return {
+    # Return the response directly to skip jsonable_encoder on large session lists
+    return ORJSONResponse({
         "success": True,
         "data": sessions,
         "totalSessions": len(sessions)
-    }
+    })
 
 # =====================================================================
 # MAIN ENTRY POINT
@@ -2214,4 +2559,21 @@ if __name__ == "__main__":
     print("  - manager@plataforma.app / manager123")
     print("="*60 + "\n")
     
-    uvicorn.run(app, host="0.0.0.0", port=8001, reload=True)
\ No newline at end of file
+    # All state (users, tokens, sessions, queues) lives in this process's
+    # memory, so extra workers would each see a different copy of it
+    if int(os.getenv("WORKERS", "1")) > 1:
+        raise SystemExit(
+            "WORKERS>1 is not supported: this backend keeps its state in memory per process"
+        )
+    
+    # Auto-reload is opt-in and needs an import string
+    if os.getenv("RELOAD", "0") == "1":
+        uvicorn.run(
+            "main_full:app",
+            app_dir=os.path.dirname(os.path.abspath(__file__)),
+            host="0.0.0.0",
+            port=8001,
+            reload=True
+        )
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
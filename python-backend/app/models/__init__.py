@@ -22,76 +22,80 @@ from .storage import (
     DocumentAttachment, DocumentAnnotation, MediaCollection, MediaCollectionItem
 )
 
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import bindparam, create_engine, event, insert, make_url, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import sessionmaker, Session, raiseload, selectinload
 from sqlalchemy.pool import StaticPool
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+import functools
 import logging
+import os
+import time
 import uuid
-from datetime import datetime
+from collections import defaultdict
+from types import MappingProxyType
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Queries slower than this are logged as warnings (1 second)
+_SLOW_NS = 1_000_000_000
+
+# Raise on lazy relationship loads instead of silently issuing N+1 queries (tests)
+RAISELOAD_ON_TEST = os.getenv('DB_RAISELOAD') == '1'
+
+# Connection pool defaults per backend, overridable with DB_POOL_SIZE,
+# DB_MAX_OVERFLOW, DB_POOL_RECYCLE and DB_POOL_TIMEOUT
+POOL_DEFAULTS = {
+    'postgresql': {'pool_size': 30, 'max_overflow': 30, 'pool_recycle': 1800, 'pool_timeout': 10},
+    'mysql': {'pool_size': 25, 'max_overflow': 25, 'pool_recycle': 1800, 'pool_timeout': 10},
+}
+DEFAULT_POOL_SETTINGS = {'pool_size': 10, 'max_overflow': 20, 'pool_recycle': 3600, 'pool_timeout': 30}
+
+# Read-mostly reference data (system permissions) cached in-process
+REFERENCE_CACHE_TTL_SECONDS = 3600
+_reference_cache: Dict[str, Tuple[float, Any]] = {}
+
 # Global session factory
 SessionLocal: Optional[sessionmaker] = None
 
-# Model registry for easy access
-MODEL_REGISTRY = {
-    # Base models
+# Abstract base models have no mapper, so they are listed explicitly
+BASE_MODELS = {
     'BaseModel': BaseModel,
     'EnhancedBaseModel': EnhancedBaseModel,
     'NamedEntityModel': NamedEntityModel,
     'ConfigurableModel': ConfigurableModel,
-    
-    # User and authentication models
-    'Organization': Organization,
-    'User': User,
-    'Role': Role,
-    'Permission': Permission,
-    'UserPermission': UserPermission,
-    'Group': Group,
-    'GroupMember': GroupMember,
-    'GroupPermission': GroupPermission,
-    'UserSession': UserSession,
-    'LoginAttempt': LoginAttempt,
-    'AuditLog': AuditLog,
-    
-    # Core business models
-    'Module': Module,
-    'ModulePermission': ModulePermission,
-    'UserModuleSettings': UserModuleSettings,
-    'Window': Window,
-    'DashboardLayout': DashboardLayout,
-    'DashboardWidget': DashboardWidget,
-    'Worksheet': Worksheet,
-    'ColumnConfig': ColumnConfig,
-    'Cell': Cell,
-    'WorksheetRelationship': WorksheetRelationship,
-    'SystemSetting': SystemSetting,
-    'Notification': Notification,
-    'NotificationTemplate': NotificationTemplate,
-    
-    # Storage and file models
-    'StorageBucket': StorageBucket,
-    'File': File,
-    'FileVersion': FileVersion,
-    'FileThumbnail': FileThumbnail,
-    'FileShare': FileShare,
-    'Document': Document,
-    'DocumentAttachment': DocumentAttachment,
-    'DocumentAnnotation': DocumentAnnotation,
-    'MediaCollection': MediaCollection,
-    'MediaCollectionItem': MediaCollectionItem,
 }
 
-# Association tables registry
-ASSOCIATION_TABLES = {
-    'user_roles': user_roles_table,
-    'role_permissions': role_permissions_table,
-    'user_permissions': user_permissions_table,
-}
+# Mapped models, grouped by their __category__ and sorted by name
+_MAPPED_MODELS = sorted(
+    (mapper.class_ for mapper in Base.registry.mappers),
+    key=lambda model_class: (getattr(model_class, '__category__', 'other'), model_class.__name__)
+)
+
+# Model registry for easy access
+MODEL_REGISTRY = MappingProxyType({
+    **BASE_MODELS,
+    **{model_class.__name__: model_class for model_class in _MAPPED_MODELS},
+})
+
+# Association tables registry: tables without a mapped class
+_MAPPED_TABLES = {model_class.__table__ for model_class in _MAPPED_MODELS}
+ASSOCIATION_TABLES = MappingProxyType({
+    name: table
+    for name, table in Base.metadata.tables.items()
+    if table not in _MAPPED_TABLES
+})
+
+# Model names grouped by domain, reported by get_database_info()
+_models_by_category = defaultdict(list)
+for _model_class in _MAPPED_MODELS:
+    _models_by_category[getattr(_model_class, '__category__', 'other')].append(_model_class.__name__)
+MODELS_BY_CATEGORY = MappingProxyType({
+    category: tuple(model_names) for category, model_names in _models_by_category.items()
+})
+del _models_by_category, _model_class
 
 
 def get_model_class(model_name: str):
@@ -107,13 +111,14 @@ def get_model_class(model_name: str):
     return MODEL_REGISTRY.get(model_name)
 
 
-def get_all_models() -> Dict[str, Any]:
-    """Get all registered models."""
-    return MODEL_REGISTRY.copy()
+def get_all_models() -> Mapping[str, Any]:
+    """Get all registered models as a read-only view of the registry."""
+    return MODEL_REGISTRY
 
 
-def get_table_names() -> List[str]:
-    """Get all table names from registered models."""
+@functools.lru_cache(maxsize=1)
+def _compute_table_names() -> Tuple[str, ...]:
+    """Compute the sorted table names once; the registry is fixed at import."""
     table_names = []
     
     for model_class in MODEL_REGISTRY.values():
@@ -124,7 +129,26 @@ def get_table_names() -> List[str]:
     for table in ASSOCIATION_TABLES.values():
         table_names.append(table.name)
     
-    return sorted(table_names)
+    return tuple(sorted(table_names))
+
+
+def prefetch(query, *attrs):
+    """
+    Eagerly load relationships with one batched SELECT ... IN query each.
+    
+    Args:
+        query: Query or select() statement to apply the loaders to
+        *attrs: Relationship attributes to load, e.g. User.roles
+        
+    Returns:
+        Query with selectinload options applied
+    """
+    return query.options(*[selectinload(attr) for attr in attrs])
+
+
+def get_table_names() -> List[str]:
+    """Get all table names from registered models."""
+    return list(_compute_table_names())
 
 
 def init_database(database_url: str, echo: bool = False, pool_pre_ping: bool = True) -> sessionmaker:
@@ -145,34 +169,82 @@ def init_database(database_url: str, echo: bool = False, pool_pre_ping: bool = T
     engine_kwargs = {
         'echo': echo,
         'pool_pre_ping': pool_pre_ping,
-        'pool_recycle': 3600,  # Recycle connections after 1 hour
-        'pool_size': 10,
-        'max_overflow': 20,
+        'query_cache_size': 1200,  # Compiled SQL cache entries per engine
     }
     
-    # Handle SQLite special case
-    if database_url.startswith('sqlite'):
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == 'sqlite':
+        # SQLite shares a single connection
         engine_kwargs.update({
             'poolclass': StaticPool,
             'connect_args': {'check_same_thread': False}
         })
-        # Remove postgres-specific settings
-        engine_kwargs.pop('pool_recycle', None)
-        engine_kwargs.pop('pool_size', None)
-        engine_kwargs.pop('max_overflow', None)
+    else:
+        pool_settings = POOL_DEFAULTS.get(backend, DEFAULT_POOL_SETTINGS)
+        engine_kwargs.update({
+            key: int(os.getenv(f"DB_{key.upper()}", value))
+            for key, value in pool_settings.items()
+        })
+        # Rows per multi-row INSERT for ORM bulk inserts (BaseModel.bulk_create)
+        engine_kwargs['insertmanyvalues_page_size'] = 1000
+        if url.get_driver_name() == 'psycopg':
+            # psycopg 3 server-side prepares statements executed this many times
+            engine_kwargs['connect_args'] = {
+                'prepare_threshold': int(os.getenv('DB_PREPARE_THRESHOLD', 5))
+            }
     
     engine = create_engine(database_url, **engine_kwargs)
     
+    # Third-party dialects must opt in, otherwise every statement is recompiled
+    if not getattr(engine.dialect, 'supports_statement_cache', False):
+        logger.warning(
+            f"Dialect '{engine.dialect.name}' does not support statement caching; "
+            "SQL will be compiled on every execution"
+        )
+    
     # Add event listeners for better database behavior
     setup_database_events(engine)
     
     # Create session factory
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     
+    if RAISELOAD_ON_TEST:
+        @event.listens_for(SessionLocal, "do_orm_execute")
+        def _apply_raiseload(orm_execute_state):
+            """Make lazy-loading relationships raise on access."""
+            if (
+                orm_execute_state.is_select
+                and not orm_execute_state.is_column_load
+                and not orm_execute_state.is_relationship_load
+            ):
+                options = [
+                    option
+                    for mapper in orm_execute_state.all_mappers
+                    for option in _lazy_raiseload_options(mapper)
+                ]
+                if options:
+                    orm_execute_state.statement = orm_execute_state.statement.options(*options)
+    
     logger.info(f"Database initialized with URL: {database_url}")
     return SessionLocal
 
 
+@functools.lru_cache(maxsize=None)
+def _lazy_raiseload_options(mapper) -> Tuple:
+    """
+    raiseload options for a mapper's lazy='select' relationships.
+    
+    Relationships configured as selectin/joined/raise keep their own loader,
+    so tests load exactly what production loads.
+    """
+    return tuple(
+        raiseload(getattr(mapper.class_, rel.key), sql_only=True)
+        for rel in mapper.relationships
+        if rel.lazy in ('select', True)
+    )
+
+
 def setup_database_events(engine):
     """
     Set up database event listeners for optimization and logging.
@@ -180,26 +252,31 @@ def setup_database_events(engine):
     Args:
         engine: SQLAlchemy engine instance
     """
+    backend = engine.dialect.name
     
-    @event.listens_for(engine, "connect")
-    def set_sqlite_pragma(dbapi_connection, connection_record):
-        """Set SQLite pragmas for better performance."""
-        if 'sqlite' in str(engine.url):
+    # Only the listener for the active backend is registered
+    if backend == 'sqlite':
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragma(dbapi_connection, connection_record):
+            """Set SQLite pragmas for better performance."""
             cursor = dbapi_connection.cursor()
-            # Enable foreign key constraints
-            cursor.execute("PRAGMA foreign_keys=ON")
-            # Use WAL mode for better concurrency
-            cursor.execute("PRAGMA journal_mode=WAL")
-            # Optimize for speed
-            cursor.execute("PRAGMA synchronous=NORMAL")
-            cursor.execute("PRAGMA cache_size=10000")
-            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.executescript(
+                # Enable foreign key constraints
+                "PRAGMA foreign_keys=ON;"
+                # Use WAL mode for better concurrency
+                "PRAGMA journal_mode=WAL;"
+                # Optimize for speed: 64MB page cache, memory temp tables, 256MB mmap
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA cache_size=-64000;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA mmap_size=268435456;"
+            )
             cursor.close()
     
-    @event.listens_for(engine, "connect")
-    def set_postgres_settings(dbapi_connection, connection_record):
-        """Set PostgreSQL settings for better performance."""
-        if 'postgresql' in str(engine.url):
+    elif backend == 'postgresql':
+        @event.listens_for(engine, "connect")
+        def set_postgres_settings(dbapi_connection, connection_record):
+            """Set PostgreSQL settings for better performance."""
             # Set timezone to UTC
             with dbapi_connection.cursor() as cursor:
                 cursor.execute("SET timezone TO 'UTC'")
@@ -207,13 +284,71 @@ def setup_database_events(engine):
     # Log slow queries
     @event.listens_for(engine, "before_cursor_execute")
     def receive_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-        context._query_start_time = datetime.now()
+        context._query_start_ns = time.perf_counter_ns()
     
     @event.listens_for(engine, "after_cursor_execute")  
     def receive_after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-        total = (datetime.now() - context._query_start_time).total_seconds()
-        if total > 1.0:  # Log queries taking more than 1 second
-            logger.warning(f"Slow query ({total:.2f}s): {statement[:200]}...")
+        elapsed = time.perf_counter_ns() - context._query_start_ns
+        if elapsed > _SLOW_NS:
+            logger.warning("Slow query (%.2fs): %s...", elapsed / 1e9, statement[:200])
+
+
+def get_cached_reference(key: str, loader):
+    """
+    Get reference data from the in-process cache, loading it on a miss.
+    
+    Args:
+        key: Cache key
+        loader: Callable returning the value to cache
+        
+    Returns:
+        Cached or freshly loaded value
+    """
+    now = time.monotonic()
+    entry = _reference_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    
+    value = loader()
+    _reference_cache[key] = (now + REFERENCE_CACHE_TTL_SECONDS, value)
+    return value
+
+
+def invalidate_reference_cache(key: Optional[str] = None):
+    """
+    Drop one cached reference entry, or all of them.
+    
+    Args:
+        key: Cache key to drop, or None to clear the cache
+    """
+    if key is None:
+        _reference_cache.clear()
+    else:
+        _reference_cache.pop(key, None)
+
+
+def get_permission_ids(session: Session) -> MappingProxyType:
+    """
+    Get a read-only mapping of permission name to permission ID.
+    
+    Args:
+        session: Database session used on a cache miss
+        
+    Returns:
+        Mapping of permission name to ID
+    """
+    return get_cached_reference(
+        'permissions',
+        lambda: MappingProxyType(dict(session.execute(select(Permission.name, Permission.id)).all()))
+    )
+
+
+@event.listens_for(Permission, 'after_insert')
+@event.listens_for(Permission, 'after_update')
+@event.listens_for(Permission, 'after_delete')
+def _invalidate_permission_cache(mapper, connection, target):
+    """Drop cached permission IDs when a permission changes through the ORM."""
+    invalidate_reference_cache('permissions')
 
 
 def create_tables(engine):
@@ -269,25 +404,39 @@ def get_database_info() -> Dict[str, Any]:
     Returns:
         Dictionary with database information
     """
-    info = {
+    table_names = _compute_table_names()
+    return {
         'total_models': len(MODEL_REGISTRY),
-        'total_tables': len(get_table_names()),
+        'total_tables': len(table_names),
         'models_by_category': {
-            'user_auth': ['Organization', 'User', 'Role', 'Permission', 'UserPermission', 
-                         'Group', 'GroupMember', 'GroupPermission', 'UserSession', 
-                         'LoginAttempt', 'AuditLog'],
-            'core_business': ['Module', 'ModulePermission', 'UserModuleSettings', 'Window',
-                            'DashboardLayout', 'DashboardWidget', 'Worksheet', 'ColumnConfig',
-                            'Cell', 'WorksheetRelationship', 'SystemSetting', 'Notification',
-                            'NotificationTemplate'],
-            'storage_files': ['StorageBucket', 'File', 'FileVersion', 'FileThumbnail', 
-                            'FileShare', 'Document', 'DocumentAttachment', 'DocumentAnnotation',
-                            'MediaCollection', 'MediaCollectionItem']
+            category: list(model_names)
+            for category, model_names in MODELS_BY_CATEGORY.items()
         },
         'association_tables': list(ASSOCIATION_TABLES.keys()),
-        'table_names': get_table_names()
+        'table_names': list(table_names)
     }
-    return info
+
+
+def _insert_missing(session: Session, model, rows: List[Dict[str, Any]]):
+    """
+    Insert rows in a single statement, skipping rows that hit a unique constraint.
+    
+    Args:
+        session: Database session
+        model: Model class to insert into
+        rows: Column values for each new row
+    """
+    if not rows:
+        return
+    
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == 'postgresql':
+        stmt = postgresql.insert(model).values(rows).on_conflict_do_nothing()
+    elif dialect_name == 'sqlite':
+        stmt = sqlite.insert(model).values(rows).on_conflict_do_nothing()
+    else:
+        stmt = insert(model).values(rows)
+    session.execute(stmt)
 
 
 def seed_initial_data(session: Session):
@@ -309,6 +458,8 @@ def seed_initial_data(session: Session):
                 description='Default organization for Plataforma.dev'
             )
             session.add(default_org)
+            # Roles below are inserted with Core and reference the organization
+            session.flush()
             logger.info("Created default organization")
         
         # Create system permissions
@@ -343,19 +494,25 @@ def seed_initial_data(session: Session):
             ('data:delete', 'Delete Data', 'Delete data from database', 'data_access', 'data', 'delete'),
         ]
         
-        for perm_name, display_name, description, category, resource, action in system_permissions:
-            existing_perm = session.query(Permission).filter_by(name=perm_name).first()
-            if not existing_perm:
-                permission = Permission(
-                    name=perm_name,
-                    display_name=display_name,
-                    description=description,
-                    category=category,
-                    resource=resource,
-                    action=action,
-                    is_system_permission=True
-                )
-                session.add(permission)
+        existing_perms = set(session.scalars(
+            select(Permission.name).where(
+                Permission.name.in_([perm[0] for perm in system_permissions])
+            )
+        ))
+        
+        _insert_missing(session, Permission, [
+            {
+                'name': perm_name,
+                'display_name': display_name,
+                'description': description,
+                'category': category,
+                'resource': resource,
+                'action': action,
+                'is_system_permission': True,
+            }
+            for perm_name, display_name, description, category, resource, action in system_permissions
+            if perm_name not in existing_perms
+        ])
         
         # Create system roles
         system_roles = [
@@ -366,20 +523,27 @@ def seed_initial_data(session: Session):
             ('readonly', 'Read Only', 'Read-only access', 4, '#6b7280', 'Eye'),
         ]
         
-        for role_name, display_name, description, level, color, icon in system_roles:
-            existing_role = session.query(Role).filter_by(name=role_name, organization_id=default_org.id).first()
-            if not existing_role:
-                role = Role(
-                    name=role_name,
-                    display_name=display_name,
-                    description=description,
-                    level=level,
-                    color=color,
-                    icon=icon,
-                    organization_id=default_org.id,
-                    is_system_role=True
-                )
-                session.add(role)
+        existing_roles = set(session.scalars(
+            select(Role.name).where(
+                Role.organization_id == default_org.id,
+                Role.name.in_([role[0] for role in system_roles])
+            )
+        ))
+        
+        _insert_missing(session, Role, [
+            {
+                'name': role_name,
+                'display_name': display_name,
+                'description': description,
+                'level': level,
+                'color': color,
+                'icon': icon,
+                'organization_id': default_org.id,
+                'is_system_role': True,
+            }
+            for role_name, display_name, description, level, color, icon in system_roles
+            if role_name not in existing_roles
+        ])
         
         # Create default storage bucket
         default_bucket = session.query(StorageBucket).filter_by(bucket_key='default').first()
@@ -410,22 +574,30 @@ def seed_initial_data(session: Session):
             ('notifications.default_expiry_hours', 168, 'number', 'notifications', False),  # 7 days
         ]
         
-        for setting_key, setting_value, data_type, category, is_public in default_settings:
-            existing_setting = session.query(SystemSetting).filter_by(setting_key=setting_key).first()
-            if not existing_setting:
-                setting = SystemSetting(
-                    name=setting_key,
-                    display_name=setting_key.replace('.', ' ').replace('_', ' ').title(),
-                    setting_key=setting_key,
-                    setting_value=setting_value,
-                    data_type=data_type,
-                    category=category,
-                    is_public=is_public
-                )
-                session.add(setting)
+        existing_settings = set(session.scalars(
+            select(SystemSetting.setting_key).where(
+                SystemSetting.setting_key.in_([setting[0] for setting in default_settings])
+            )
+        ))
+        
+        _insert_missing(session, SystemSetting, [
+            {
+                'name': setting_key,
+                'display_name': setting_key.replace('.', ' ').replace('_', ' ').title(),
+                'setting_key': setting_key,
+                'setting_value': setting_value,
+                'data_type': data_type,
+                'category': category,
+                'is_public': is_public,
+            }
+            for setting_key, setting_value, data_type, category, is_public in default_settings
+            if setting_key not in existing_settings
+        ])
         
         # Commit all changes
         session.commit()
+        # Core inserts bypass mapper events, so drop cached permissions here
+        invalidate_reference_cache('permissions')
         logger.info("Database seeded with initial data successfully")
         
     except Exception as e:
@@ -434,6 +606,46 @@ def seed_initial_data(session: Session):
         raise
 
 
+def _fetch_table_counts(session: Session, table_names: List[str]) -> Optional[Dict[str, int]]:
+    """
+    Fetch row counts for the given tables in a single round trip.
+    
+    PostgreSQL counts are the planner estimates from pg_class, so they do not
+    scan the tables. Tables missing from the database are left out.
+    
+    Args:
+        session: Database session
+        table_names: Tables to count
+        
+    Returns:
+        Mapping of table name to row count, or None if the dialect is not supported
+    """
+    dialect = session.get_bind().dialect
+    
+    if dialect.name == 'postgresql':
+        stmt = text(
+            "SELECT relname, GREATEST(reltuples, 0)::bigint FROM pg_class "
+            "WHERE relkind IN ('r', 'p') AND relnamespace = to_regnamespace(current_schema()) "
+            "AND relname IN :names"
+        ).bindparams(bindparam('names', expanding=True))
+        return dict(session.execute(stmt, {'names': table_names}).all())
+    
+    if dialect.name == 'sqlite':
+        stmt = text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN :names"
+        ).bindparams(bindparam('names', expanding=True))
+        existing = session.scalars(stmt, {'names': table_names}).all()
+        if not existing:
+            return {}
+        quote = dialect.identifier_preparer.quote
+        union = " UNION ALL ".join(
+            f"SELECT '{name}', (SELECT COUNT(*) FROM {quote(name)})" for name in existing
+        )
+        return dict(session.execute(text(union)).all())
+    
+    return None
+
+
 def validate_database_schema(session: Session) -> Dict[str, Any]:
     """
     Validate the database schema and return status information.
@@ -455,31 +667,41 @@ def validate_database_schema(session: Session) -> Dict[str, Any]:
     
     try:
         # Check if required tables exist and get counts
-        for model_name, model_class in MODEL_REGISTRY.items():
-            if hasattr(model_class, '__tablename__'):
-                try:
-                    count = session.query(model_class).count()
-                    validation_results['table_counts'][model_class.__tablename__] = count
-                except Exception as e:
-                    validation_results['errors'].append(f"Error querying {model_class.__tablename__}: {e}")
+        model_tables = [
+            model_class.__tablename__
+            for model_class in MODEL_REGISTRY.values()
+            if hasattr(model_class, '__tablename__')
+        ]
+        table_counts = _fetch_table_counts(session, model_tables)
+        
+        if table_counts is not None:
+            validation_results['table_counts'] = table_counts
+            for table_name in model_tables:
+                if table_name not in table_counts:
+                    validation_results['errors'].append(f"Table {table_name} does not exist")
                     validation_results['valid'] = False
+        else:
+            # Unknown dialect: fall back to counting each table
+            for model_name, model_class in MODEL_REGISTRY.items():
+                if hasattr(model_class, '__tablename__'):
+                    try:
+                        count = session.query(model_class).count()
+                        validation_results['table_counts'][model_class.__tablename__] = count
+                    except Exception as e:
+                        validation_results['errors'].append(f"Error querying {model_class.__tablename__}: {e}")
+                        validation_results['valid'] = False
         
         # Check for required initial data
-        org_count = session.query(Organization).count()
-        if org_count == 0:
-            validation_results['warnings'].append("No organizations found - consider running seed_initial_data()")
-        
-        perm_count = session.query(Permission).count()
-        if perm_count == 0:
-            validation_results['warnings'].append("No permissions found - consider running seed_initial_data()")
-        
-        role_count = session.query(Role).count()
-        if role_count == 0:
-            validation_results['warnings'].append("No roles found - consider running seed_initial_data()")
+        required_data = [
+            (Organization, "No organizations found"),
+            (Permission, "No permissions found"),
+            (Role, "No roles found"),
+            (StorageBucket, "No storage buckets found"),
+        ]
         
-        bucket_count = session.query(StorageBucket).count()
-        if bucket_count == 0:
-            validation_results['warnings'].append("No storage buckets found - consider running seed_initial_data()")
+        for model_class, message in required_data:
+            if session.scalar(select(model_class.id).limit(1)) is None:
+                validation_results['warnings'].append(f"{message} - consider running seed_initial_data()")
         
     except Exception as e:
         validation_results['errors'].append(f"Schema validation error: {e}")
@@ -496,5 +718,6 @@ __all__ = [
     'StorageBucket', 'File', 'Document',
     'MODEL_REGISTRY', 'ASSOCIATION_TABLES',
     'init_database', 'create_tables', 'drop_tables', 'get_db_session',
-    'seed_initial_data', 'validate_database_schema', 'get_database_info'
+    'seed_initial_data', 'validate_database_schema', 'get_database_info',
+    'prefetch', 'get_permission_ids', 'invalidate_reference_cache'
 ]
\ No newline at end of file
@@ -4,18 +4,23 @@ System administration database models.
 This module contains SQLAlchemy models for admin-related operations.
 """
 
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 
 from sqlalchemy import (
-    Column, Integer, String, Text, Boolean, DateTime, ForeignKey,
-    JSON, Enum as SQLEnum, Index, UniqueConstraint, CheckConstraint, Float
+    BigInteger, Column, Computed, Integer, String, Text, Boolean, DateTime, ForeignKey,
+    Enum as SQLEnum, Index, UniqueConstraint, CheckConstraint, Float,
+    DDL, LargeBinary, SmallInteger, TypeDecorator, event, select, text
 )
 from sqlalchemy.orm import relationship, validates
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB
+from sqlalchemy.ext.associationproxy import association_proxy
 import enum
-import uuid
+import orjson
+import re
+import time
+import zlib
 
 from .base import Base
 from ..schemas.admin import (
@@ -25,21 +30,177 @@ from ..schemas.admin import (
 )
 
 
+# Small integer codes for enums stored on high-volume tables; log levels
+# keep the logging module's ordering so range filters work on the codes
+ENUM_CODES = {
+    LogLevel: {
+        LogLevel.DEBUG: 10,
+        LogLevel.INFO: 20,
+        LogLevel.WARNING: 30,
+        LogLevel.ERROR: 40,
+        LogLevel.CRITICAL: 50,
+    },
+    AuditAction: {
+        AuditAction.CREATE: 1,
+        AuditAction.READ: 2,
+        AuditAction.UPDATE: 3,
+        AuditAction.DELETE: 4,
+        AuditAction.LOGIN: 5,
+        AuditAction.LOGOUT: 6,
+        AuditAction.PERMISSION_CHANGE: 7,
+        AuditAction.SYSTEM_CHANGE: 8,
+    },
+}
+
+
+class SmallIntEnum(TypeDecorator):
+    """Store a str enum as a SMALLINT code while exposing enum members in Python."""
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+        self._to_code = ENUM_CODES[enum_class]
+        self._from_code = {code: member for member, code in self._to_code.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._from_code[value]
+
+
+class OrjsonBlob(TypeDecorator):
+    """Store JSON that is only returned verbatim as orjson-encoded bytes."""
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.loads(value)
+
+
+# Append-only tables range-partitioned by month on their timestamp column
+PARTITIONED_TABLES = ('audit_logs', 'security_events', 'system_logs')
+
+
+def create_monthly_partition(connection, table_name: str, year: int, month: int):
+    """
+    Create the partition holding one month of rows for a partitioned table.
+    
+    Args:
+        connection: SQLAlchemy connection
+        table_name: One of PARTITIONED_TABLES
+        year: Partition year
+        month: Partition month (1-12)
+    """
+    if table_name not in PARTITIONED_TABLES:
+        raise ValueError(f"Table {table_name} is not partitioned")
+    
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    connection.execute(DDL(
+        f"CREATE TABLE IF NOT EXISTS {table_name}_{year:04d}_{month:02d} "
+        f"PARTITION OF {table_name} "
+        f"FOR VALUES FROM ('{year:04d}-{month:02d}-01') TO ('{next_year:04d}-{next_month:02d}-01')"
+    ))
+
+
+# Rows per multi-row INSERT when bulk logging
+LOG_INSERT_BATCH_SIZE = 50
+
+
+def _insert_in_batches(session, table, records: List[Dict[str, Any]], batch: int):
+    """Insert records with one multi-row INSERT per batch."""
+    for start in range(0, len(records), batch):
+        session.execute(table.insert().values(records[start:start + batch]))
+
+
+# Rows fetched per round trip when streaming log exports
+LOG_STREAM_BATCH_SIZE = 500
+
+
+def _list_select(model):
+    """Build a select of a model's list view columns, newest first."""
+    columns = [model.__table__.c[name] for name in model.__list_columns__]
+    return select(*columns).order_by(model.__table__.c.timestamp.desc())
+
+
+def _list_rows(model, session, limit: int, offset: int) -> List[Any]:
+    """Fetch one page of list columns as RowMappings instead of ORM instances."""
+    return session.execute(_list_select(model).limit(limit).offset(offset)).mappings().all()
+
+
+def _stream_rows(model, session, batch: int):
+    """Yield list columns as RowMappings, fetching batch rows per round trip."""
+    result = session.execute(
+        _list_select(model).execution_options(yield_per=batch)
+    ).mappings()
+    yield from result
+
+
+# In-process TTL cache for hot system setting and feature flag reads
+ADMIN_CACHE_TTL_SECONDS = 30
+ADMIN_CACHE_MAX_ENTRIES = 1024
+_admin_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_CACHE_MISS = object()
+
+
+def _admin_cache_get(cache_key: str) -> Any:
+    """Get a cached value, or _CACHE_MISS if absent or expired."""
+    entry = _admin_cache.get(cache_key)
+    if entry is None:
+        return _CACHE_MISS
+    if entry[0] <= time.monotonic():
+        _admin_cache.pop(cache_key, None)
+        return _CACHE_MISS
+    return entry[1]
+
+
+def _admin_cache_set(cache_key: str, value: Any):
+    """Cache a value, evicting the oldest entries past the size limit."""
+    _admin_cache[cache_key] = (time.monotonic() + ADMIN_CACHE_TTL_SECONDS, value)
+    _admin_cache.move_to_end(cache_key)
+    while len(_admin_cache) > ADMIN_CACHE_MAX_ENTRIES:
+        _admin_cache.popitem(last=False)
+
+
+def invalidate_admin_cache(cache_key: Optional[str] = None):
+    """Drop one cached setting/flag entry, or all of them."""
+    if cache_key is None:
+        _admin_cache.clear()
+    else:
+        _admin_cache.pop(cache_key, None)
+
+
+# Setting keys use dot notation for hierarchical settings
+_SETTING_KEY_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9._-]*$')
+
+
 class SystemSetting(Base):
     """Model for system settings."""
     __tablename__ = "system_settings"
     __table_args__ = (
-        Index('idx_setting_key', 'key'),
         Index('idx_setting_category', 'category'),
-        Index('idx_setting_is_public', 'is_public'),
         Index('idx_setting_updated_at', 'updated_at'),
+        Index('idx_setting_value_gin', 'value', postgresql_using='gin', postgresql_ops={'value': 'jsonb_path_ops'}),
         UniqueConstraint('key', name='uq_setting_key'),
         CheckConstraint('char_length(key) >= 1', name='ck_setting_key_length'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    key = Column(String(255), nullable=False, unique=True)
-    value = Column(JSON, nullable=False)
+    key = Column(String(255), nullable=False)
+    value = Column(JSONB, nullable=False)
     setting_type = Column(SQLEnum(SettingType), nullable=False)
     
     description = Column(Text)
@@ -50,16 +211,16 @@ class SystemSetting(Base):
     is_editable = Column(Boolean, default=True)
     
     # Metadata
-    default_value = Column(JSON)
-    validation_rules = Column(JSON, default=dict)
+    default_value = Column(JSONB)
+    validation_rules = Column(JSONB, default=dict)
     
     # Tracking
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     updated_by = Column(Integer, ForeignKey('users.id'))
     
     # Relationships
-    updater = relationship("User")
+    updater = relationship("User", lazy='raise')
 
     @validates('key')
     def validate_key(self, key_name, key_value):
@@ -67,9 +228,7 @@ class SystemSetting(Base):
         if not key_value or not key_value.strip():
             raise ValueError("Setting key cannot be empty")
         
-        # Use dot notation for hierarchical settings
-        import re
-        if not re.match(r'^[a-zA-Z][a-zA-Z0-9._-]*$', key_value):
+        if not _SETTING_KEY_RE.match(key_value):
             raise ValueError("Setting key must start with letter and contain only letters, numbers, dots, hyphens, and underscores")
         
         return key_value.lower()
@@ -81,37 +240,66 @@ class SystemSetting(Base):
 class AuditLog(Base):
     """Model for audit logging."""
     __tablename__ = "audit_logs"
+    # Columns returned by list views and exports
+    __list_columns__ = ('id', 'user_id', 'action', 'resource_type', 'resource_id', 'ip_address', 'timestamp')
     __table_args__ = (
-        Index('idx_audit_user_id', 'user_id'),
+        Index('idx_audit_user_ts', 'user_id', 'timestamp'),
         Index('idx_audit_action', 'action'),
-        Index('idx_audit_resource_type', 'resource_type'),
+        Index('idx_audit_resource', 'resource_type', 'resource_id', 'timestamp'),
         Index('idx_audit_resource_id', 'resource_id'),
+        Index('idx_audit_timestamp_brin', 'timestamp', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        # BRIN cannot return rows in order; list views page by ORDER BY timestamp DESC
         Index('idx_audit_timestamp', 'timestamp'),
         Index('idx_audit_ip_address', 'ip_address'),
+        Index('idx_audit_details_gin', 'details', postgresql_using='gin', postgresql_ops={'details': 'jsonb_path_ops'}),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
     )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'))
     
-    action = Column(SQLEnum(AuditAction), nullable=False)
+    action = Column(SmallIntEnum(AuditAction), nullable=False)
     resource_type = Column(String(100), nullable=False)
     resource_id = Column(String(255))
     
     # Event details
-    details = Column(JSON, default=dict)
-    old_values = Column(JSON)  # Previous values for updates
-    new_values = Column(JSON)  # New values for updates
+    details = Column(JSONB, default=dict)
+    old_values = Column(OrjsonBlob)  # Previous values for updates
+    new_values = Column(OrjsonBlob)  # New values for updates
     
     # Request context
     ip_address = Column(String(45))  # IPv6 compatible
     user_agent = Column(Text)
-    request_id = Column(String(36))
+    request_id = Column(UUID(as_uuid=True))
     session_id = Column(String(255))
     
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Partition key, so it must be part of the primary key
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), primary_key=True)
     
     # Relationships
-    user = relationship("User", back_populates="audit_logs")
+    user = relationship("User", back_populates="audit_logs", lazy='raise')
+
+    @classmethod
+    def bulk_log(cls, session, records: List[Dict[str, Any]], batch: int = LOG_INSERT_BATCH_SIZE):
+        """
+        Insert many audit log rows without creating ORM instances.
+        
+        Args:
+            session: Database session
+            records: Column values for each audit log row
+            batch: Rows per INSERT statement
+        """
+        _insert_in_batches(session, cls.__table__, records, batch)
+
+    @classmethod
+    def list_rows(cls, session, limit: int = 100, offset: int = 0) -> List[Any]:
+        """Get a page of audit log list columns, newest first, as RowMappings."""
+        return _list_rows(cls, session, limit, offset)
+
+    @classmethod
+    def stream_rows(cls, session, batch: int = LOG_STREAM_BATCH_SIZE):
+        """Stream all audit log list columns, newest first, for exports."""
+        return _stream_rows(cls, session, batch)
 
     def __repr__(self):
         return f"<AuditLog(id={self.id}, user_id={self.user_id}, action='{self.action}', resource='{self.resource_type}')>"
@@ -125,17 +313,19 @@ class SecurityEvent(Base):
         Index('idx_security_severity', 'severity'),
         Index('idx_security_user_id', 'user_id'),
         Index('idx_security_timestamp', 'timestamp'),
-        Index('idx_security_resolved', 'resolved'),
+        Index('idx_security_unresolved', 'severity', 'timestamp', postgresql_where=text('resolved = false')),
         Index('idx_security_ip_address', 'ip_address'),
+        Index('idx_security_details_gin', 'details', postgresql_using='gin', postgresql_ops={'details': 'jsonb_path_ops'}),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
     )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     event_type = Column(SQLEnum(SecurityEventType), nullable=False)
     severity = Column(SQLEnum(SecurityEventSeverity), nullable=False)
     
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
-    details = Column(JSON, nullable=False, default=dict)
+    details = Column(JSONB, nullable=False, default=dict)
     
     # Related entities
     user_id = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'))
@@ -145,18 +335,19 @@ class SecurityEvent(Base):
     # Resolution tracking
     resolved = Column(Boolean, default=False)
     resolved_by = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'))
-    resolved_at = Column(DateTime)
+    resolved_at = Column(DateTime(timezone=True))
     resolution_notes = Column(Text)
     
     # Alert tracking
     alert_sent = Column(Boolean, default=False)
-    alert_sent_at = Column(DateTime)
+    alert_sent_at = Column(DateTime(timezone=True))
     
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Partition key, so it must be part of the primary key
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), primary_key=True)
     
     # Relationships
-    user = relationship("User", foreign_keys=[user_id])
-    resolver = relationship("User", foreign_keys=[resolved_by])
+    user = relationship("User", foreign_keys=[user_id], lazy='raise')
+    resolver = relationship("User", foreign_keys=[resolved_by], lazy='raise')
 
     def __repr__(self):
         return f"<SecurityEvent(id={self.id}, type='{self.event_type}', severity='{self.severity}', resolved={self.resolved})>"
@@ -177,15 +368,18 @@ class SystemHealth(Base):
     
     # Health details
     message = Column(String(500))
-    details = Column(JSON, default=dict)
+    details = Column(JSONB, default=dict)
     
     # Metrics
     response_time = Column(Float)  # in milliseconds
+    cpu_percent = Column(Float)
+    memory_mb = Column(Float)
+    queue_depth = Column(Integer)
     uptime = Column(Integer)  # in seconds
     error_count = Column(Integer, default=0)
     
-    last_check = Column(DateTime, default=datetime.utcnow, nullable=False)
-    last_error = Column(DateTime)
+    last_check = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(DateTime(timezone=True))
     
     # Alert thresholds
     warning_threshold = Column(Float)
@@ -211,28 +405,34 @@ class MaintenanceWindow(Base):
     maintenance_type = Column(SQLEnum(MaintenanceType), nullable=False)
     
     # Scheduling
-    scheduled_start = Column(DateTime, nullable=False)
-    scheduled_end = Column(DateTime, nullable=False)
-    actual_start = Column(DateTime)
-    actual_end = Column(DateTime)
+    scheduled_start = Column(DateTime(timezone=True), nullable=False)
+    scheduled_end = Column(DateTime(timezone=True), nullable=False)
+    actual_start = Column(DateTime(timezone=True))
+    actual_end = Column(DateTime(timezone=True))
     
     # Status and impact
     status = Column(String(50), default="scheduled")  # scheduled, in_progress, completed, cancelled
-    affected_services = Column(ARRAY(String), nullable=False)
     estimated_downtime = Column(Integer)  # in minutes
     
     # Communication
     notification_sent = Column(Boolean, default=False)
-    notification_sent_at = Column(DateTime)
+    notification_sent_at = Column(DateTime(timezone=True))
     public_message = Column(Text)  # Message to show users
     
     # Tracking
     created_by = Column(Integer, ForeignKey('users.id'), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    creator = relationship("User", back_populates="maintenance_windows")
+    creator = relationship("User", back_populates="maintenance_windows", lazy='raise')
+    affected_service_links = relationship(
+        "MaintenanceAffectedService", cascade="all, delete-orphan", lazy='selectin'
+    )
+    affected_services = association_proxy(
+        'affected_service_links', 'service_name',
+        creator=lambda service_name: MaintenanceAffectedService(service_name=service_name)
+    )
 
     @validates('scheduled_start', 'scheduled_end')
     def validate_schedule(self, key, value):
@@ -246,29 +446,45 @@ class MaintenanceWindow(Base):
         return f"<MaintenanceWindow(id={self.id}, title='{self.title}', type='{self.maintenance_type}', status='{self.status}')>"
 
 
+class MaintenanceAffectedService(Base):
+    """Model linking maintenance windows to the services they affect."""
+    __tablename__ = "maintenance_affected_services"
+    __table_args__ = (
+        Index('idx_maintenance_service_name', 'service_name'),
+    )
+
+    maintenance_id = Column(Integer, ForeignKey('maintenance_windows.id', ondelete='CASCADE'), primary_key=True)
+    service_name = Column(String(100), primary_key=True)
+
+    def __repr__(self):
+        return f"<MaintenanceAffectedService(maintenance_id={self.maintenance_id}, service='{self.service_name}')>"
+
+
 class BackupJob(Base):
     """Model for backup jobs."""
     __tablename__ = "backup_jobs"
     __table_args__ = (
         Index('idx_backup_backup_type', 'backup_type'),
         Index('idx_backup_status', 'status'),
-        Index('idx_backup_started_at', 'started_at'),
+        Index('idx_backup_started_at_brin', 'started_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('idx_backup_created_by', 'created_by'),
+        Index('idx_backup_data_gin', 'backup_data', postgresql_using='gin', postgresql_ops={'backup_data': 'jsonb_path_ops'}),
     )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     backup_type = Column(SQLEnum(BackupType), nullable=False)
     status = Column(SQLEnum(BackupStatus), nullable=False)
     
     # Backup details
-    size = Column(Integer)  # in bytes
+    size = Column(BigInteger)  # in bytes
+    size_mb = Column(Float, Computed("round(coalesce(size, 0) / 1048576.0, 2)::float8", persisted=True))
     file_count = Column(Integer)
     location = Column(String(500), nullable=False)
     checksum = Column(String(64))  # SHA-256
     
     # Timing
-    started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    completed_at = Column(DateTime)
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    completed_at = Column(DateTime(timezone=True))
     duration = Column(Integer)  # in seconds
     
     # Error handling
@@ -276,21 +492,16 @@ class BackupJob(Base):
     retry_count = Column(Integer, default=0)
     
     # Metadata
-    backup_data = Column(JSON, default=dict)  # Additional backup metadata
+    backup_data = Column(JSONB, default=dict)  # Additional backup metadata
     
     # Tracking
     created_by = Column(Integer, ForeignKey('users.id'))
     
     # Relationships
-    creator = relationship("User")
-
-    @hybrid_property
-    def size_mb(self):
-        """Get backup size in MB."""
-        return round(self.size / (1024 * 1024), 2) if self.size else 0
+    creator = relationship("User", lazy='raise')
 
     def __repr__(self):
-        return f"<BackupJob(id='{self.id}', type='{self.backup_type}', status='{self.status}', size={self.size_mb}MB)>"
+        return f"<BackupJob(id='{self.id}', type='{self.backup_type}', status='{self.status}', size={self.size_mb or 0}MB)>"
 
 
 class BackupSchedule(Base):
@@ -298,8 +509,7 @@ class BackupSchedule(Base):
     __tablename__ = "backup_schedules"
     __table_args__ = (
         Index('idx_schedule_backup_type', 'backup_type'),
-        Index('idx_schedule_is_enabled', 'is_enabled'),
-        Index('idx_schedule_next_run', 'next_run'),
+        Index('idx_schedule_next_run_enabled', 'next_run', postgresql_where=text('is_enabled = true')),
         Index('idx_schedule_created_by', 'created_by'),
     )
 
@@ -321,21 +531,21 @@ class BackupSchedule(Base):
     notify_on_failure = Column(Boolean, default=True)
     
     # Execution tracking
-    last_run = Column(DateTime)
-    next_run = Column(DateTime)
-    last_success = Column(DateTime)
+    last_run = Column(DateTime(timezone=True))
+    next_run = Column(DateTime(timezone=True))
+    last_success = Column(DateTime(timezone=True))
     consecutive_failures = Column(Integer, default=0)
     
     # Metadata
-    backup_options = Column(JSON, default=dict)
+    backup_options = Column(OrjsonBlob, default=dict)
     
     # Tracking
     created_by = Column(Integer, ForeignKey('users.id'), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    creator = relationship("User")
+    creator = relationship("User", lazy='raise')
 
     def __repr__(self):
         return f"<BackupSchedule(id={self.id}, name='{self.name}', type='{self.backup_type}', enabled={self.is_enabled})>"
@@ -344,17 +554,23 @@ class BackupSchedule(Base):
 class SystemLog(Base):
     """Model for system logs."""
     __tablename__ = "system_logs"
+    # Columns returned by list views and exports
+    __list_columns__ = ('id', 'level', 'message', 'module', 'user_id', 'request_id', 'timestamp')
     __table_args__ = (
-        Index('idx_log_level', 'level'),
+        Index('idx_log_level_ts', 'level', 'timestamp'),
         Index('idx_log_module', 'module'),
         Index('idx_log_user_id', 'user_id'),
+        Index('idx_log_timestamp_brin', 'timestamp', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        # BRIN cannot return rows in order; list views page by ORDER BY timestamp DESC
         Index('idx_log_timestamp', 'timestamp'),
         Index('idx_log_session_id', 'session_id'),
         Index('idx_log_request_id', 'request_id'),
+        Index('idx_log_extra_data_gin', 'extra_data', postgresql_using='gin', postgresql_ops={'extra_data': 'jsonb_path_ops'}),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
     )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    level = Column(SQLEnum(LogLevel), nullable=False)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    level = Column(SmallIntEnum(LogLevel), nullable=False)
     message = Column(Text, nullable=False)
     
     # Source information
@@ -365,16 +581,39 @@ class SystemLog(Base):
     # Context
     user_id = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'))
     session_id = Column(String(255))
-    request_id = Column(String(36))
+    request_id = Column(UUID(as_uuid=True))
     
     # Additional data
-    extra_data = Column(JSON, default=dict)
+    extra_data = Column(JSONB, default=dict)
     stack_trace = Column(Text)
     
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Partition key, so it must be part of the primary key
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), primary_key=True)
     
     # Relationships
-    user = relationship("User")
+    user = relationship("User", lazy='raise')
+
+    @classmethod
+    def bulk_log(cls, session, records: List[Dict[str, Any]], batch: int = LOG_INSERT_BATCH_SIZE):
+        """
+        Insert many system log rows without creating ORM instances.
+        
+        Args:
+            session: Database session
+            records: Column values for each log row
+            batch: Rows per INSERT statement
+        """
+        _insert_in_batches(session, cls.__table__, records, batch)
+
+    @classmethod
+    def list_rows(cls, session, limit: int = 100, offset: int = 0) -> List[Any]:
+        """Get a page of system log list columns, newest first, as RowMappings."""
+        return _list_rows(cls, session, limit, offset)
+
+    @classmethod
+    def stream_rows(cls, session, batch: int = LOG_STREAM_BATCH_SIZE):
+        """Stream all system log list columns, newest first, for exports."""
+        return _stream_rows(cls, session, batch)
 
     def __repr__(self):
         return f"<SystemLog(id={self.id}, level='{self.level}', module='{self.module}', timestamp={self.timestamp})>"
@@ -385,7 +624,7 @@ class PerformanceAlert(Base):
     __tablename__ = "performance_alerts"
     __table_args__ = (
         Index('idx_alert_metric', 'metric'),
-        Index('idx_alert_is_enabled', 'is_enabled'),
+        Index('idx_alert_metric_enabled', 'metric', postgresql_where=text('is_enabled = true')),
         Index('idx_alert_last_triggered', 'last_triggered'),
         Index('idx_alert_created_by', 'created_by'),
     )
@@ -409,17 +648,19 @@ class PerformanceAlert(Base):
     notification_interval = Column(Integer, default=1800)  # Seconds between notifications
     
     # Tracking
-    last_triggered = Column(DateTime)
+    last_triggered = Column(DateTime(timezone=True))
     trigger_count = Column(Integer, default=0)
-    last_notification_sent = Column(DateTime)
+    last_notification_sent = Column(DateTime(timezone=True))
     
     created_by = Column(Integer, ForeignKey('users.id'), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    creator = relationship("User")
-    alert_instances = relationship("SystemAlert", back_populates="alert_config", cascade="all, delete-orphan")
+    creator = relationship("User", lazy='raise')
+    alert_instances = relationship(
+        "SystemAlert", back_populates="alert_config", cascade="all, delete-orphan", lazy='selectin'
+    )
 
     def __repr__(self):
         return f"<PerformanceAlert(id={self.id}, name='{self.name}', metric='{self.metric}', threshold={self.threshold})>"
@@ -431,12 +672,13 @@ class SystemAlert(Base):
     __table_args__ = (
         Index('idx_alert_instance_alert_id', 'alert_id'),
         Index('idx_alert_instance_severity', 'severity'),
-        Index('idx_alert_instance_acknowledged', 'acknowledged'),
-        Index('idx_alert_instance_resolved', 'resolved'),
-        Index('idx_alert_instance_triggered_at', 'triggered_at'),
+        Index('idx_alert_instance_unacknowledged', 'triggered_at', postgresql_where=text('acknowledged = false')),
+        Index('idx_alert_instance_unresolved', 'triggered_at', postgresql_where=text('resolved = false')),
+        Index('idx_alert_instance_triggered_at_brin', 'triggered_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        Index('idx_alert_instance_context_gin', 'context_data', postgresql_using='gin', postgresql_ops={'context_data': 'jsonb_path_ops'}),
     )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     alert_id = Column(Integer, ForeignKey('performance_alerts.id', ondelete='CASCADE'), nullable=False)
     
     severity = Column(String(20), nullable=False)
@@ -446,21 +688,21 @@ class SystemAlert(Base):
     # Status
     acknowledged = Column(Boolean, default=False)
     acknowledged_by = Column(Integer, ForeignKey('users.id'))
-    acknowledged_at = Column(DateTime)
+    acknowledged_at = Column(DateTime(timezone=True))
     
     resolved = Column(Boolean, default=False)
-    resolved_at = Column(DateTime)
+    resolved_at = Column(DateTime(timezone=True))
     resolution_notes = Column(Text)
     
     # Timing
-    triggered_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    triggered_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Additional data
-    context_data = Column(JSON, default=dict)
+    context_data = Column(JSONB, default=dict)
     
     # Relationships
-    alert_config = relationship("PerformanceAlert", back_populates="alert_instances")
-    acknowledger = relationship("User", foreign_keys=[acknowledged_by])
+    alert_config = relationship("PerformanceAlert", back_populates="alert_instances", lazy='raise')
+    acknowledger = relationship("User", foreign_keys=[acknowledged_by], lazy='raise')
 
     def __repr__(self):
         return f"<SystemAlert(id={self.id}, alert_id={self.alert_id}, severity='{self.severity}', resolved={self.resolved})>"
@@ -470,15 +712,17 @@ class FeatureFlag(Base):
     """Model for feature flags."""
     __tablename__ = "feature_flags"
     __table_args__ = (
-        Index('idx_feature_key', 'key'),
-        Index('idx_feature_is_enabled', 'is_enabled'),
+        Index('idx_feature_key_enabled', 'key', postgresql_where=text('is_enabled = true')),
         Index('idx_feature_created_by', 'created_by'),
+        Index('idx_feature_conditions_gin', 'conditions', postgresql_using='gin', postgresql_ops={'conditions': 'jsonb_path_ops'}),
+        Index('idx_feature_target_roles_gin', 'target_roles', postgresql_using='gin'),
+        Index('idx_feature_tags_gin', 'tags', postgresql_using='gin'),
         UniqueConstraint('key', name='uq_feature_key'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
-    key = Column(String(255), nullable=False, unique=True)
+    key = Column(String(255), nullable=False)
     description = Column(Text)
     
     # Flag configuration
@@ -486,18 +730,24 @@ class FeatureFlag(Base):
     rollout_percentage = Column(Integer, default=0, nullable=False)  # 0-100
     
     # Targeting
-    target_users = Column(ARRAY(Integer), default=list)
     target_roles = Column(ARRAY(String), default=list)
-    conditions = Column(JSON, default=dict)
+    conditions = Column(JSONB, default=dict)
     
     # Metadata
     tags = Column(ARRAY(String), default=list)
     created_by = Column(Integer, ForeignKey('users.id'), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    creator = relationship("User")
+    creator = relationship("User", lazy='raise')
+    target_user_links = relationship(
+        "FeatureFlagTargetUser", cascade="all, delete-orphan", lazy='selectin'
+    )
+    target_users = association_proxy(
+        'target_user_links', 'user_id',
+        creator=lambda user_id: FeatureFlagTargetUser(user_id=user_id)
+    )
 
     @validates('rollout_percentage')
     def validate_rollout_percentage(self, key, value):
@@ -506,5 +756,161 @@ class FeatureFlag(Base):
             raise ValueError("Rollout percentage must be between 0 and 100")
         return value
 
+    @classmethod
+    def is_enabled_for(cls, user_id: Optional[int], cached_flag: Dict[str, Any], role: Optional[str] = None) -> bool:
+        """
+        Evaluate a cached flag snapshot for a user without touching the database.
+        
+        Users outside the target lists fall in a stable rollout bucket derived
+        from the flag key and user ID.
+        
+        Args:
+            user_id: ID of the user being checked
+            cached_flag: Snapshot returned by get_feature_flag()
+            role: Role of the user being checked
+            
+        Returns:
+            True if the flag is on for the user
+        """
+        if not cached_flag['is_enabled']:
+            return False
+        if user_id in cached_flag['target_users'] or role in cached_flag['target_roles']:
+            return True
+        if cached_flag['rollout_percentage'] >= 100:
+            return True
+        if user_id is None:
+            return False
+        bucket = zlib.crc32(f"{cached_flag['key']}:{user_id}".encode()) % 100
+        return bucket < cached_flag['rollout_percentage']
+
+    def __repr__(self):
+        return f"<FeatureFlag(id={self.id}, key='{self.key}', enabled={self.is_enabled}, rollout={self.rollout_percentage}%)>"
+
+
+class FeatureFlagTargetUser(Base):
+    """Model linking feature flags to the users they target."""
+    __tablename__ = "feature_flag_target_users"
+    __table_args__ = (
+        Index('idx_feature_target_user_id', 'user_id'),
+    )
+
+    feature_flag_id = Column(Integer, ForeignKey('feature_flags.id', ondelete='CASCADE'), primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+
     def __repr__(self):
-        return f"<FeatureFlag(id={self.id}, key='{self.key}', enabled={self.is_enabled}, rollout={self.rollout_percentage}%)>"
\ No newline at end of file
+        return f"<FeatureFlagTargetUser(feature_flag_id={self.feature_flag_id}, user_id={self.user_id})>"
+
+
+# Wide, highly repetitive text columns compressed with lz4 (PostgreSQL 14+),
+# set before the default partitions below are created so they inherit it
+LZ4_COMPRESSED_COLUMNS = {
+    AuditLog: ('user_agent',),
+    SecurityEvent: ('description',),
+    SystemLog: ('message', 'stack_trace'),
+}
+
+for _model, _columns in LZ4_COMPRESSED_COLUMNS.items():
+    event.listen(
+        _model.__table__,
+        'after_create',
+        DDL(
+            f"ALTER TABLE {_model.__tablename__} "
+            + ", ".join(f"ALTER COLUMN {column} SET COMPRESSION lz4" for column in _columns)
+        ).execute_if(dialect='postgresql'),
+    )
+
+
+# Default partitions catch rows outside the monthly ranges created so far
+for _model in (AuditLog, SecurityEvent, SystemLog):
+    event.listen(
+        _model.__table__,
+        'after_create',
+        DDL(
+            f"CREATE TABLE IF NOT EXISTS {_model.__tablename__}_default "
+            f"PARTITION OF {_model.__tablename__} DEFAULT"
+        ).execute_if(dialect='postgresql'),
+    )
+
+
+def get_setting(session, key: str, default: Any = None) -> Any:
+    """
+    Get a system setting value, served from the in-process cache when fresh.
+    
+    Args:
+        session: Database session used on a cache miss
+        key: Setting key
+        default: Value returned when the setting does not exist
+        
+    Returns:
+        Setting value or default
+    """
+    key = key.lower()
+    cache_key = f"setting:{key}"
+    value = _admin_cache_get(cache_key)
+    if value is _CACHE_MISS:
+        value = session.execute(
+            select(SystemSetting.value).where(SystemSetting.key == key)
+        ).scalar_one_or_none()
+        _admin_cache_set(cache_key, value)
+    return default if value is None else value
+
+
+def get_feature_flag(session, key: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a plain snapshot of a feature flag's targeting config, cached in-process.
+    
+    Args:
+        session: Database session used on a cache miss
+        key: Feature flag key
+        
+    Returns:
+        Flag snapshot dict, or None if the flag does not exist
+    """
+    cache_key = f"flag:{key}"
+    snapshot = _admin_cache_get(cache_key)
+    if snapshot is _CACHE_MISS:
+        flag = session.scalars(select(FeatureFlag).where(FeatureFlag.key == key)).first()
+        snapshot = None if flag is None else {
+            'key': flag.key,
+            'is_enabled': flag.is_enabled,
+            'rollout_percentage': flag.rollout_percentage,
+            'target_users': frozenset(flag.target_users),
+            'target_roles': frozenset(flag.target_roles or ()),
+        }
+        _admin_cache_set(cache_key, snapshot)
+    return snapshot
+
+
+def is_feature_enabled(session, key: str, user_id: Optional[int] = None, role: Optional[str] = None) -> bool:
+    """
+    Check whether a feature flag is on for a user.
+    
+    Args:
+        session: Database session used on a cache miss
+        key: Feature flag key
+        user_id: ID of the user being checked
+        role: Role of the user being checked
+        
+    Returns:
+        True if the flag is enabled and the user is targeted or in the rollout
+    """
+    flag = get_feature_flag(session, key)
+    if flag is None:
+        return False
+    return FeatureFlag.is_enabled_for(user_id, flag, role)
+
+
+@event.listens_for(SystemSetting, 'after_insert')
+@event.listens_for(SystemSetting, 'after_update')
+@event.listens_for(SystemSetting, 'after_delete')
+def _invalidate_setting_cache(mapper, connection, target):
+    """Drop the cached value when a setting changes."""
+    invalidate_admin_cache(f"setting:{target.key}")
+
+
+@event.listens_for(FeatureFlag, 'after_insert')
+@event.listens_for(FeatureFlag, 'after_update')
+@event.listens_for(FeatureFlag, 'after_delete')
+def _invalidate_feature_flag_cache(mapper, connection, target):
+    """Drop the cached snapshot when a flag or its target users change."""
+    invalidate_admin_cache(f"flag:{target.key}")
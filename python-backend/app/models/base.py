@@ -5,18 +5,39 @@ This module provides common database patterns, audit trails, and base functional
 for all SQLAlchemy models in the system.
 """
 
+import re
+import unicodedata
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
-from sqlalchemy import Column, String, DateTime, Boolean, Text, UUID, JSON, Integer, Index
-from sqlalchemy.ext.declarative import declarative_base, declared_attr
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, DateTime, Boolean, Text, UUID, Integer, Index, DDL, event, inspect
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column, relationship
 from sqlalchemy.sql import func
 import sqlalchemy as sa
 
 
 # Create the base class for all models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
+
+
+# Slug generation: transliterate accented Latin text to ASCII, strip characters
+# that are not word, space or hyphen, then collapse runs of hyphens/whitespace.
+# Text with no ASCII form (Cyrillic, CJK, ...) keeps its Unicode word characters.
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+_SLUG_ASCII_STRIP = {
+    code: None for code in range(128)
+    if not (chr(code).isalnum() or chr(code).isspace() or chr(code) in '_-')
+}
+
+# Serializers for column values that are not JSON-native, keyed by exact type
+_TO_DICT_CONVERTERS = {
+    datetime: datetime.isoformat,
+    uuid.UUID: str,
+}
 
 
 class BaseModel(Base):
@@ -26,46 +47,214 @@ class BaseModel(Base):
     """
     __abstract__ = True
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Maintained by a BEFORE UPDATE trigger (see below), so Core bulk updates set it too
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), server_onupdate=sa.FetchedValue(), nullable=False)
+
+    @declared_attr.directive
+    def __mapper_args__(cls):
+        return _mapper_args(cls)
 
     def __repr__(self) -> str:
         """String representation of the model."""
         return f"<{self.__class__.__name__}(id={self.id})>"
 
-    def to_dict(self, exclude_fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    def to_dict(self, exclude_fields: Optional[List[str]] = None, native: bool = False) -> Dict[str, Any]:
         """
         Convert model instance to dictionary.
         
         Args:
             exclude_fields: List of field names to exclude from the dict
+            native: Keep datetime and UUID values as-is for encoders that
+                handle them natively (orjson), instead of converting to strings
             
         Returns:
             Dictionary representation of the model
         """
-        exclude_fields = exclude_fields or []
+        if not exclude_fields:
+            attr = '_to_dict_native' if native else '_to_dict_full'
+            to_dict_fn = self.__class__.__dict__.get(attr)
+            if to_dict_fn is None:
+                to_dict_fn = self._build_to_dict_full(native)
+            return to_dict_fn(self)
+        
+        converters = {} if native else _TO_DICT_CONVERTERS
         result = {}
         
-        for column in self.__table__.columns:
-            if column.name not in exclude_fields:
-                value = getattr(self, column.name)
+        for column_name, attr_name in self._get_dict_columns():
+            if column_name not in exclude_fields:
+                value = getattr(self, attr_name)
                 # Handle datetime and UUID serialization
-                if isinstance(value, datetime):
-                    result[column.name] = value.isoformat()
-                elif isinstance(value, uuid.UUID):
-                    result[column.name] = str(value)
-                else:
-                    result[column.name] = value
+                converter = converters.get(type(value))
+                result[column_name] = converter(value) if converter else value
         
         return result
 
+    @classmethod
+    def _get_dict_columns(cls):
+        """Get (column name, attribute name) pairs for to_dict, cached per class."""
+        columns = cls.__dict__.get('_dict_columns')
+        if columns is None:
+            columns = tuple(
+                (attr.columns[0].name, attr.key)
+                for attr in inspect(cls).mapper.column_attrs
+            )
+            cls._dict_columns = columns
+        return columns
+
+    @classmethod
+    def _build_to_dict_full(cls, native: bool = False):
+        """
+        Generate a straight-line to_dict for this class with no exclusions.
+        
+        Each column becomes one attribute load, converted according to the
+        column's Python type, so serialization needs no loop or type checks.
+        
+        Args:
+            native: Leave datetime and UUID values unconverted
+            
+        Returns:
+            Generated function taking a model instance
+        """
+        mapper = inspect(cls).mapper
+        fields = []
+        
+        for column_name, attr_name in cls._get_dict_columns():
+            try:
+                python_type = mapper.columns[attr_name].type.python_type
+            except NotImplementedError:
+                python_type = None
+            
+            if native or python_type is None:
+                value = f"self.{attr_name}"
+            elif issubclass(python_type, datetime):
+                value = f"None if (v := self.{attr_name}) is None else v.isoformat()"
+            elif issubclass(python_type, uuid.UUID):
+                value = f"None if (v := self.{attr_name}) is None else str(v)"
+            else:
+                value = f"self.{attr_name}"
+            fields.append(f"        {column_name!r}: {value},")
+        
+        name = '_to_dict_native' if native else '_to_dict_full'
+        source = "\n".join([f"def {name}(self):", "    return {", *fields, "    }"])
+        namespace = {}
+        exec(compile(source, f"<{cls.__name__}.to_dict>", "exec"), namespace)
+        setattr(cls, name, namespace[name])
+        return namespace[name]
+
+    @classmethod
+    def bulk_create(cls, session, rows: List[Dict[str, Any]], page_size: int = 1000):
+        """
+        Insert many records with batched multi-row INSERTs.
+        
+        Args:
+            session: Database session
+            rows: Column values for each new record
+            page_size: Rows per INSERT statement
+        """
+        if not rows:
+            return
+        session.execute(
+            sa.insert(cls).execution_options(insertmanyvalues_page_size=page_size),
+            rows
+        )
+
+    @classmethod
+    def bulk_update(cls, session, rows: List[Dict[str, Any]]):
+        """
+        Update many records by primary key with one executemany UPDATE.
+        
+        For versioned models (VersionMixin) each row must also carry the
+        'version' it was read at; the UPDATE then matches on it, bumps it,
+        and raises StaleDataError if another writer got there first.
+        
+        Args:
+            session: Database session
+            rows: Column values for each record, each including its 'id'
+            
+        Raises:
+            ValueError: If a versioned model's row has no 'version'
+        """
+        if not rows:
+            return
+        version_col = inspect(cls).version_id_col
+        if version_col is not None:
+            version_key = inspect(cls).get_property_by_column(version_col).key
+            if any(version_key not in row for row in rows):
+                raise ValueError(
+                    f"bulk_update on {cls.__name__} requires the current '{version_key}' "
+                    "in every row for optimistic locking"
+                )
+        session.execute(sa.update(cls), rows)
+
     @classmethod
     def get_table_name(cls) -> str:
         """Get the table name for this model."""
         return cls.__tablename__
 
 
+def _mapper_args(cls) -> Dict[str, Any]:
+    """
+    Mapper arguments shared by BaseModel and VersionMixin.
+    
+    Both declare __mapper_args__ and only one wins in the MRO, so each
+    returns the combined arguments for the class being mapped.
+    """
+    args = {}
+    if issubclass(cls, BaseModel):
+        # Fetch server-generated values (updated_at) with RETURNING in the
+        # flush instead of a lazy SELECT on next access
+        args['eager_defaults'] = True
+    if issubclass(cls, VersionMixin):
+        args['version_id_col'] = cls.version
+    return args
+
+
+# updated_at is set by the database on every UPDATE, including Core
+# sa.update() statements that do not mention it
+event.listen(
+    Base.metadata,
+    'before_create',
+    DDL(
+        "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$ "
+        "BEGIN NEW.updated_at = now(); RETURN NEW; END; "
+        "$$ LANGUAGE plpgsql"
+    ).execute_if(dialect='postgresql'),
+)
+
+
+@event.listens_for(BaseModel, 'instrument_class', propagate=True)
+def _add_updated_at_trigger(mapper, cls):
+    """Attach the updated_at trigger DDL to each concrete BaseModel table."""
+    table = mapper.local_table
+    if table is None or table.info.get('updated_at_trigger'):
+        return
+    table.info['updated_at_trigger'] = True
+    
+    event.listen(
+        table,
+        'after_create',
+        DDL(
+            "CREATE TRIGGER %(table)s_set_updated_at BEFORE UPDATE ON %(table)s "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        ).execute_if(dialect='postgresql'),
+    )
+    # SQLite has no BEFORE UPDATE row rewrite; touch the row after updates
+    # that left updated_at unchanged (recursive_triggers is off by default).
+    # RETURNING there reports the row before this trigger ran, so after a
+    # flush the in-memory updated_at can lag until the next refresh.
+    event.listen(
+        table,
+        'after_create',
+        DDL(
+            "CREATE TRIGGER %(table)s_set_updated_at AFTER UPDATE ON %(table)s "
+            "FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at BEGIN "
+            "UPDATE %(table)s SET updated_at = CURRENT_TIMESTAMP WHERE rowid = NEW.rowid; END"
+        ).execute_if(dialect='sqlite'),
+    )
+
+
 class AuditMixin:
     """
     Mixin for tracking who created and updated records.
@@ -73,12 +262,12 @@ class AuditMixin:
     """
     
     @declared_attr
-    def created_by_id(cls):
-        return Column(UUID(as_uuid=True), nullable=True, comment="ID of user who created this record")
+    def created_by_id(cls) -> Mapped[Optional[uuid.UUID]]:
+        return mapped_column(UUID(as_uuid=True), nullable=True, comment="ID of user who created this record")
     
     @declared_attr
-    def updated_by_id(cls):
-        return Column(UUID(as_uuid=True), nullable=True, comment="ID of user who last updated this record")
+    def updated_by_id(cls) -> Mapped[Optional[uuid.UUID]]:
+        return mapped_column(UUID(as_uuid=True), nullable=True, comment="ID of user who last updated this record")
 
     def set_audit_fields(self, user_id: Optional[uuid.UUID], is_creation: bool = False):
         """
@@ -88,11 +277,40 @@ class AuditMixin:
             user_id: ID of the user performing the action
             is_creation: Whether this is a creation (sets created_by) or update
         """
-        if is_creation and hasattr(self, 'created_by_id'):
+        if is_creation:
             self.created_by_id = user_id
-        
-        if hasattr(self, 'updated_by_id'):
-            self.updated_by_id = user_id
+        self.updated_by_id = user_id
+
+
+class AuditRelationshipsMixin:
+    """
+    Opt-in mixin exposing audit user IDs as User relationships.
+    Use together with AuditMixin and SoftDeleteMixin (e.g. on EnhancedBaseModel
+    subclasses). created_by/updated_by load in one batched SELECT ... IN per
+    result set; deleted_by is rarely traversed and raises on lazy access, so
+    callers must request it with selectinload().
+    """
+
+    @declared_attr
+    def created_by(cls):
+        return relationship(
+            'User', primaryjoin=f"foreign({cls.__name__}.created_by_id) == User.id",
+            viewonly=True, lazy='selectin'
+        )
+
+    @declared_attr
+    def updated_by(cls):
+        return relationship(
+            'User', primaryjoin=f"foreign({cls.__name__}.updated_by_id) == User.id",
+            viewonly=True, lazy='selectin'
+        )
+
+    @declared_attr
+    def deleted_by(cls):
+        return relationship(
+            'User', primaryjoin=f"foreign({cls.__name__}.deleted_by_id) == User.id",
+            viewonly=True, lazy='raise'
+        )
 
 
 class SoftDeleteMixin:
@@ -101,9 +319,9 @@ class SoftDeleteMixin:
     Records are marked as deleted instead of being physically removed.
     """
     
-    deleted_at = Column(DateTime(timezone=True), nullable=True, comment="Timestamp when record was soft deleted")
-    deleted_by_id = Column(UUID(as_uuid=True), nullable=True, comment="ID of user who deleted this record")
-    is_deleted = Column(Boolean, default=False, nullable=False, comment="Flag indicating if record is soft deleted")
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, comment="Timestamp when record was soft deleted")
+    deleted_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True, comment="ID of user who deleted this record")
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, server_default=sa.false(), nullable=False, comment="Flag indicating if record is soft deleted")
 
     def soft_delete(self, deleted_by: Optional[uuid.UUID] = None):
         """
@@ -113,7 +331,7 @@ class SoftDeleteMixin:
             deleted_by: ID of user performing the deletion
         """
         self.is_deleted = True
-        self.deleted_at = datetime.utcnow()
+        self.deleted_at = datetime.now(timezone.utc)
         self.deleted_by_id = deleted_by
 
     def restore(self):
@@ -122,8 +340,29 @@ class SoftDeleteMixin:
         self.deleted_at = None
         self.deleted_by_id = None
 
+    @classmethod
+    def bulk_soft_delete(cls, session, ids: List[uuid.UUID], deleted_by: Optional[uuid.UUID] = None) -> int:
+        """
+        Soft delete many records in one UPDATE, timestamped by the database.
+        
+        Args:
+            session: Database session
+            ids: IDs of the records to delete
+            deleted_by: ID of user performing the deletion
+            
+        Returns:
+            Number of records updated
+        """
+        result = session.execute(
+            sa.update(cls)
+            .where(cls.id.in_(ids))
+            .values(is_deleted=True, deleted_at=func.now(), deleted_by_id=deleted_by)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     @property
-    def is_active(self) -> bool:
+    def is_not_deleted(self) -> bool:
         """Check if record is not soft deleted."""
         return not self.is_deleted
 
@@ -131,14 +370,34 @@ class SoftDeleteMixin:
 class VersionMixin:
     """
     Mixin for optimistic locking using version numbers.
-    Helps prevent concurrent modification conflicts.
+    Helps prevent concurrent modification conflicts: the ORM bumps the version
+    in each UPDATE and raises StaleDataError if the row changed underneath it.
     """
     
-    version = Column(Integer, default=0, nullable=False, comment="Version number for optimistic locking")
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False, comment="Version number for optimistic locking")
+
+    @declared_attr.directive
+    def __mapper_args__(cls):
+        return _mapper_args(cls)
 
-    def increment_version(self):
-        """Increment the version number."""
-        self.version += 1
+    @classmethod
+    def bump_version(cls, session, record_id: uuid.UUID):
+        """
+        Increment a record's version in the database without loading it.
+        
+        A copy of the record already loaded in the session picks up the new
+        version, so its next flush does not fail the version check.
+        
+        Args:
+            session: Database session
+            record_id: ID of the record to bump
+        """
+        session.execute(
+            sa.update(cls)
+            .where(cls.id == record_id)
+            .values(version=cls.version + 1)
+            .execution_options(synchronize_session='fetch')
+        )
 
 
 class MetadataMixin:
@@ -147,7 +406,7 @@ class MetadataMixin:
     Useful for configuration, settings, and extensible data.
     """
     
-    metadata_ = Column('metadata', JSON, default={}, nullable=False, comment="Flexible metadata storage")
+    metadata_: Mapped[Dict[str, Any]] = mapped_column('metadata', MutableDict.as_mutable(JSONB), default={}, nullable=False, comment="Flexible metadata storage")
 
     def get_metadata(self, key: str, default: Any = None) -> Any:
         """
@@ -193,7 +452,7 @@ class StatusMixin:
     Mixin for records that have an active/inactive status.
     """
     
-    is_active = Column(Boolean, default=True, nullable=False, comment="Whether this record is active")
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default=sa.true(), nullable=False, comment="Whether this record is active")
 
     def activate(self):
         """Mark record as active."""
@@ -210,9 +469,9 @@ class NamedMixin:
     Common pattern for many business entities.
     """
     
-    name = Column(String(100), nullable=False, comment="Internal name/identifier")
-    display_name = Column(String(255), nullable=False, comment="Human-readable display name")
-    description = Column(Text, nullable=True, comment="Optional description")
+    name: Mapped[str] = mapped_column(String(100), nullable=False, comment="Internal name/identifier")
+    display_name: Mapped[str] = mapped_column(String(255), nullable=False, comment="Human-readable display name")
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="Optional description")
 
     @property
     def label(self) -> str:
@@ -226,16 +485,36 @@ class TimestampMixin:
     Extends base timestamps with last activity and access times.
     """
     
-    last_accessed_at = Column(DateTime(timezone=True), nullable=True, comment="Last time record was accessed")
-    last_activity_at = Column(DateTime(timezone=True), nullable=True, comment="Last time record had activity")
+    last_accessed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, comment="Last time record was accessed")
+    last_activity_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, comment="Last time record had activity")
 
     def touch_accessed(self):
         """Update last accessed timestamp."""
-        self.last_accessed_at = datetime.utcnow()
+        self.last_accessed_at = datetime.now(timezone.utc)
 
     def touch_activity(self):
         """Update last activity timestamp."""
-        self.last_activity_at = datetime.utcnow()
+        self.last_activity_at = datetime.now(timezone.utc)
+
+    @classmethod
+    def bulk_touch_accessed(cls, session, ids: List[uuid.UUID]) -> int:
+        """
+        Update last accessed timestamp for many records in one UPDATE.
+        
+        Args:
+            session: Database session
+            ids: IDs of the records to touch
+            
+        Returns:
+            Number of records updated
+        """
+        result = session.execute(
+            sa.update(cls)
+            .where(cls.id.in_(ids))
+            .values(last_accessed_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
 
 class SlugMixin:
@@ -244,7 +523,7 @@ class SlugMixin:
     Useful for records that need clean URLs.
     """
     
-    slug = Column(String(150), nullable=True, unique=True, comment="URL-friendly identifier")
+    slug: Mapped[Optional[str]] = mapped_column(String(150), nullable=True, unique=True, comment="URL-friendly identifier")
 
     @staticmethod
     def generate_slug(text: str) -> str:
@@ -255,13 +534,30 @@ class SlugMixin:
             text: Text to convert to slug
             
         Returns:
-            URL-friendly slug
+            URL-friendly slug (never empty)
+            
+        Raises:
+            ValueError: If the text has no letters or digits to build a slug from
         """
-        import re
-        # Convert to lowercase and replace spaces with hyphens
-        slug = re.sub(r'[^\w\s-]', '', text.lower())
-        slug = re.sub(r'[-\s]+', '-', slug)
-        return slug.strip('-')
+        text = text.lower()
+        if not text.isascii():
+            # Drop accents ("ação" -> "acao"); keep the Unicode text if
+            # anything besides accents would be lost
+            decomposed = unicodedata.normalize('NFKD', text)
+            stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+            if stripped.isascii():
+                text = stripped
+        
+        # Replace spaces with hyphens
+        if text.isascii():
+            slug = text.translate(_SLUG_ASCII_STRIP)
+        else:
+            slug = _SLUG_STRIP_RE.sub('', text)
+        slug = _SLUG_DASH_RE.sub('-', slug).strip('-')
+        slug = slug[:DatabaseConstraints.MAX_SLUG_LENGTH].rstrip('-')
+        if not slug:
+            raise ValueError(f"Cannot build a slug from {text!r}: no letters or digits")
+        return slug
 
 
 # Enhanced Base Model combining common mixins
@@ -288,7 +584,7 @@ class ConfigurableModel(EnhancedBaseModel, NamedMixin):
     """
     __abstract__ = True
     
-    settings = Column(JSON, default={}, nullable=False, comment="Configuration settings")
+    settings: Mapped[Dict[str, Any]] = mapped_column(MutableDict.as_mutable(JSONB), default={}, nullable=False, comment="Configuration settings")
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a configuration setting."""
@@ -314,40 +610,68 @@ class ModelUtils:
     """Utility class for common model operations."""
 
     @staticmethod
-    def create_indexes_for_common_fields():
+    def create_indexes_for_common_fields(table_name: str) -> List[Index]:
         """
         Create common indexes that should be applied to tables using mixins.
-        This should be called after all models are defined.
+        Index names are prefixed with the table name so the helper can be
+        used on any number of tables.
+        
+        Args:
+            table_name: Table the indexes belong to
+            
+        Returns:
+            Indexes to add to the table's __table_args__
         """
+        def name(suffix: str) -> str:
+            return f"ix_{table_name}_{suffix}"
+        
         indexes = []
         
         # Common indexes for audit fields
         indexes.extend([
-            Index('idx_created_at', 'created_at'),
-            Index('idx_updated_at', 'updated_at'),
-            Index('idx_created_by', 'created_by_id'),
-            Index('idx_updated_by', 'updated_by_id'),
+            Index(name('created_at'), 'created_at'),
+            Index(name('updated_at_active'), 'updated_at', postgresql_where=sa.text('is_deleted = false')),
+            Index(name('created_by_id'), 'created_by_id'),
+            Index(name('updated_by_id'), 'updated_by_id'),
         ])
         
-        # Soft delete indexes
+        # Soft delete and status indexes; only the rows each filter selects
         indexes.extend([
-            Index('idx_is_deleted', 'is_deleted'),
-            Index('idx_deleted_at', 'deleted_at'),
+            Index(name('active_not_deleted'), 'is_active', postgresql_where=sa.text('is_deleted = false')),
+            Index(name('deleted_at'), 'deleted_at', postgresql_where=sa.text('deleted_at IS NOT NULL')),
         ])
         
-        # Status indexes
+        # Metadata containment lookups
         indexes.extend([
-            Index('idx_is_active', 'is_active'),
+            Index(name('metadata_gin'), 'metadata', postgresql_using='gin'),
         ])
         
+        # Case-insensitive NamedMixin lookups: on PostgreSQL, lower(name) = lower(:q)
+        # and lower(name) LIKE 'prefix%' both use a text_pattern_ops expression index
+        for column in ('name', 'display_name'):
+            label = f"{column}_lower"
+            indexes.append(Index(
+                name(label),
+                sa.func.lower(sa.column(column)).label(label),
+                postgresql_ops={label: 'text_pattern_ops'},
+            ))
+        
         return indexes
 
     @staticmethod
-    def get_active_records_filter():
-        """Get SQLAlchemy filter for active (non-deleted) records."""
+    def get_active_records_filter(model):
+        """
+        Get SQLAlchemy filter for active (non-deleted) records.
+        
+        is_deleted is NOT NULL, so a plain equality lets the planner use the
+        idx_active_not_deleted partial index.
+        
+        Args:
+            model: Mapped model class to filter (SoftDeleteMixin and StatusMixin)
+        """
         return sa.and_(
-            sa.or_(BaseModel.is_deleted.is_(None), BaseModel.is_deleted.is_(False)),
-            BaseModel.is_active.is_(True)
+            model.is_deleted == sa.false(),
+            model.is_active == sa.true()
         )
 
 
@@ -379,6 +703,38 @@ class DatabaseConstraints:
     MAX_URL_LENGTH = 2048
     MAX_COLOR_LENGTH = 7
 
+    # Compiled patterns for Python-side validation
+    EMAIL_RE = re.compile(EMAIL_PATTERN)
+    PHONE_RE = re.compile(PHONE_PATTERN)
+    USERNAME_RE = re.compile(USERNAME_PATTERN)
+    SLUG_RE = re.compile(SLUG_PATTERN)
+    COLOR_HEX_RE = re.compile(COLOR_HEX_PATTERN)
+
+    @classmethod
+    def validate_email(cls, value: str) -> bool:
+        """Check a value against the email pattern."""
+        return cls.EMAIL_RE.fullmatch(value) is not None
+
+    @classmethod
+    def validate_phone(cls, value: str) -> bool:
+        """Check a value against the phone pattern."""
+        return cls.PHONE_RE.fullmatch(value) is not None
+
+    @classmethod
+    def validate_username(cls, value: str) -> bool:
+        """Check a value against the username pattern."""
+        return cls.USERNAME_RE.fullmatch(value) is not None
+
+    @classmethod
+    def validate_slug(cls, value: str) -> bool:
+        """Check a value against the slug pattern."""
+        return cls.SLUG_RE.fullmatch(value) is not None
+
+    @classmethod
+    def validate_color(cls, value: str) -> bool:
+        """Check a value against the color hex pattern."""
+        return cls.COLOR_HEX_RE.fullmatch(value) is not None
+
     @classmethod
     def get_email_constraint(cls, column_name: str = 'email'):
         """Get email validation constraint."""
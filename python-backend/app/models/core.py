@@ -19,7 +19,7 @@ from sqlalchemy import (
     ForeignKey, UniqueConstraint, CheckConstraint, Index, Float,
     ARRAY, BigInteger, SmallInteger
 )
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy.orm import relationship, backref, object_session
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.dialects.postgresql import JSONB
 import sqlalchemy as sa
@@ -101,6 +101,7 @@ class Module(NamedEntityModel, ConfigurableModel, VersionMixin):
     Tracks installed modules, their configuration, and lifecycle.
     """
     __tablename__ = 'modules'
+    __category__ = 'core_business'
 
     # Module identification
     module_id = Column(String(100), nullable=False, unique=True, comment="Unique module identifier")
@@ -160,6 +161,7 @@ class Module(NamedEntityModel, ConfigurableModel, VersionMixin):
         Index('idx_modules_category', 'category'),
         Index('idx_modules_installed', 'installed_at'),
         Index('idx_modules_last_used', 'last_used_at'),
+        Index('idx_modules_deps_gin', 'dependencies', postgresql_using='gin', postgresql_ops={'dependencies': 'jsonb_path_ops'}),
     )
 
     @property
@@ -187,11 +189,26 @@ class Module(NamedEntityModel, ConfigurableModel, VersionMixin):
         return effective_settings
 
     def get_user_settings(self, user_id: uuid.UUID) -> Optional['UserModuleSettings']:
-        """Get user-specific settings for this module."""
-        for user_settings in self.user_module_settings:
-            if user_settings.user_id == user_id:
-                return user_settings
-        return None
+        """
+        Get user-specific settings for this module.
+        
+        Uses the already-loaded user_module_settings collection if present,
+        otherwise a single lookup on the (user_id, module_id) unique index
+        instead of loading every user's settings.
+        """
+        session = object_session(self)
+        if session is None or 'user_module_settings' in self.__dict__:
+            for user_settings in self.user_module_settings:
+                if user_settings.user_id == user_id:
+                    return user_settings
+            return None
+        
+        return session.execute(
+            sa.select(UserModuleSettings).where(
+                UserModuleSettings.user_id == user_id,
+                UserModuleSettings.module_id == self.id
+            )
+        ).scalar_one_or_none()
 
     def can_be_used_by_user(self, user_id: uuid.UUID) -> bool:
         """
@@ -213,6 +230,7 @@ class ModulePermission(BaseModel):
     Permissions required by modules to function.
     """
     __tablename__ = 'module_permissions'
+    __category__ = 'core_business'
 
     module_id = Column(UUID(as_uuid=True), ForeignKey('modules.id', ondelete='CASCADE'), nullable=False)
     permission_name = Column(String(100), nullable=False)
@@ -234,6 +252,7 @@ class UserModuleSettings(BaseModel):
     User-specific module settings and preferences.
     """
     __tablename__ = 'user_module_settings'
+    __category__ = 'core_business'
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     module_id = Column(UUID(as_uuid=True), ForeignKey('modules.id', ondelete='CASCADE'), nullable=False)
@@ -249,6 +268,7 @@ class UserModuleSettings(BaseModel):
         UniqueConstraint('user_id', 'module_id', name='uq_user_module_settings'),
         Index('idx_user_module_settings_user', 'user_id'),
         Index('idx_user_module_settings_module', 'module_id'),
+        Index('idx_user_module_settings_gin', 'settings', postgresql_using='gin', postgresql_ops={'settings': 'jsonb_path_ops'}),
     )
 
 
@@ -258,6 +278,7 @@ class Window(EnhancedBaseModel, TimestampMixin):
     Tracks window states, positions, and configurations.
     """
     __tablename__ = 'windows'
+    __category__ = 'core_business'
 
     # Window identification
     window_id = Column(String(100), nullable=False, comment="Unique window identifier")
@@ -357,6 +378,7 @@ class DashboardLayout(EnhancedBaseModel, VersionMixin):
     User dashboard layouts and configurations.
     """
     __tablename__ = 'dashboard_layouts'
+    __category__ = 'core_business'
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     name = Column(String(100), nullable=False, comment="Layout name")
@@ -392,6 +414,7 @@ class DashboardWidget(BaseModel, VersionMixin):
     Individual widgets on dashboard layouts.
     """
     __tablename__ = 'dashboard_widgets'
+    __category__ = 'core_business'
 
     layout_id = Column(UUID(as_uuid=True), ForeignKey('dashboard_layouts.id', ondelete='CASCADE'), nullable=False)
     widget_type = Column(String(50), nullable=False, comment="Widget type (module, shortcut, metric, etc.)")
@@ -440,6 +463,7 @@ class Worksheet(EnhancedBaseModel, VersionMixin, TimestampMixin):
     Worksheet/spreadsheet model for data management.
     """
     __tablename__ = 'worksheets'
+    __category__ = 'core_business'
 
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -462,7 +486,12 @@ class Worksheet(EnhancedBaseModel, VersionMixin, TimestampMixin):
 
     # Relationships
     owner = relationship("User")
-    cells = relationship("Cell", back_populates="worksheet", cascade="all, delete-orphan")
+    # Worksheets can hold millions of cells; never load them all implicitly.
+    # Accessing or appending to ws.cells on a persisted worksheet raises;
+    # create cells with Cell(worksheet=ws, ...) or worksheet_id instead, and
+    # look them up with get_cell(). Deletes rely on the ON DELETE CASCADE.
+    cells = relationship("Cell", back_populates="worksheet", cascade="all, delete-orphan",
+                         lazy='raise', passive_deletes=True)
     columns = relationship("ColumnConfig", back_populates="worksheet", cascade="all, delete-orphan")
     relationships_source = relationship("WorksheetRelationship", 
                                       foreign_keys="WorksheetRelationship.source_worksheet_id",
@@ -481,14 +510,44 @@ class Worksheet(EnhancedBaseModel, VersionMixin, TimestampMixin):
         Index('idx_worksheets_public', 'is_public'),
         Index('idx_worksheets_template', 'is_template', 'template_category'),
         Index('idx_worksheets_active', 'is_active'),
+        Index('idx_worksheets_settings_gin', 'settings', postgresql_using='gin', postgresql_ops={'settings': 'jsonb_path_ops'}),
     )
 
     def get_cell(self, row_num: int, col_name: str) -> Optional['Cell']:
-        """Get a specific cell by coordinates."""
-        for cell in self.cells:
-            if cell.row_num == row_num and cell.col_name == col_name:
+        """
+        Get a specific cell by coordinates.
+        
+        A single probe of the (worksheet_id, row_num, col_name) index
+        (idx_cells_coordinates); the cells collection is never loaded.
+        Cells added to the session but not yet flushed are found as well.
+        """
+        session = object_session(self)
+        if session is None:
+            # Transient or detached: only the cells attached in memory
+            candidates = self.__dict__.get('cells', ())
+        else:
+            # Sessions run with autoflush off, so pending cells are not in the database yet
+            candidates = session.new
+        
+        for cell in candidates:
+            if (
+                isinstance(cell, Cell)
+                and (cell.__dict__.get('worksheet') is self or
+                     (self.id is not None and cell.worksheet_id == self.id))
+                and cell.row_num == row_num
+                and cell.col_name == col_name
+            ):
                 return cell
-        return None
+        
+        if session is None:
+            return None
+        return session.execute(
+            sa.select(Cell).where(
+                Cell.worksheet_id == self.id,
+                Cell.row_num == row_num,
+                Cell.col_name == col_name
+            )
+        ).scalar_one_or_none()
 
 
 class ColumnConfig(BaseModel, VersionMixin):
@@ -496,6 +555,7 @@ class ColumnConfig(BaseModel, VersionMixin):
     Column configuration for worksheets.
     """
     __tablename__ = 'column_configs'
+    __category__ = 'core_business'
 
     worksheet_id = Column(UUID(as_uuid=True), ForeignKey('worksheets.id', ondelete='CASCADE'), nullable=False)
     col_name = Column(String(10), nullable=False, comment="Column name (A, B, C, etc.)")
@@ -536,6 +596,7 @@ class Cell(BaseModel, VersionMixin, TimestampMixin):
     Individual cell data in worksheets.
     """
     __tablename__ = 'cells'
+    __category__ = 'core_business'
 
     worksheet_id = Column(UUID(as_uuid=True), ForeignKey('worksheets.id', ondelete='CASCADE'), nullable=False)
     row_num = Column(BigInteger, nullable=False, comment="Row number (1-based)")
@@ -591,6 +652,7 @@ class WorksheetRelationship(EnhancedBaseModel):
     Relationships between worksheets for data linking.
     """
     __tablename__ = 'worksheet_relationships'
+    __category__ = 'core_business'
 
     name = Column(String(100), nullable=False)
     relationship_type = Column(sa.Enum(RelationshipType), nullable=False)
@@ -627,6 +689,7 @@ class SystemSetting(NamedEntityModel):
     System-wide configuration settings.
     """
     __tablename__ = 'system_settings'
+    __category__ = 'core_business'
 
     setting_key = Column(String(100), nullable=False, unique=True)
     setting_value = Column(JSONB, nullable=False, comment="Setting value (any JSON type)")
@@ -649,6 +712,7 @@ class Notification(EnhancedBaseModel, TimestampMixin):
     User notifications system.
     """
     __tablename__ = 'notifications'
+    __category__ = 'core_business'
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     title = Column(String(200), nullable=False)
@@ -699,6 +763,7 @@ class Notification(EnhancedBaseModel, TimestampMixin):
         Index('idx_notifications_category', 'category'),
         Index('idx_notifications_expires', 'expires_at'),
         Index('idx_notifications_module', 'module_name'),
+        Index('idx_notifications_data_gin', 'data', postgresql_using='gin', postgresql_ops={'data': 'jsonb_path_ops'}),
     )
 
     @property
@@ -722,6 +787,7 @@ class NotificationTemplate(NamedEntityModel):
     Templates for generating notifications.
     """
     __tablename__ = 'notification_templates'
+    __category__ = 'core_business'
 
     template_key = Column(String(100), nullable=False, unique=True)
     title_template = Column(String(200), nullable=False)
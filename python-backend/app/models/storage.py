@@ -86,6 +86,7 @@ class StorageBucket(NamedEntityModel):
     Storage buckets for organizing files.
     """
     __tablename__ = 'storage_buckets'
+    __category__ = 'storage_files'
 
     bucket_key = Column(String(100), nullable=False, unique=True, comment="Unique bucket identifier")
     provider = Column(sa.Enum(StorageProvider), nullable=False)
@@ -168,6 +169,7 @@ class File(EnhancedBaseModel, VersionMixin, TimestampMixin):
     File storage model with comprehensive metadata.
     """
     __tablename__ = 'files'
+    __category__ = 'storage_files'
 
     # File identification
     file_key = Column(String(255), nullable=False, unique=True, comment="Unique file identifier")
@@ -324,6 +326,7 @@ class FileVersion(BaseModel, TimestampMixin):
     File version tracking for versioned files.
     """
     __tablename__ = 'file_versions'
+    __category__ = 'storage_files'
 
     file_id = Column(UUID(as_uuid=True), ForeignKey('files.id', ondelete='CASCADE'), nullable=False)
     version_number = Column(Integer, nullable=False)
@@ -359,6 +362,7 @@ class FileThumbnail(BaseModel):
     Generated thumbnails for files.
     """
     __tablename__ = 'file_thumbnails'
+    __category__ = 'storage_files'
 
     file_id = Column(UUID(as_uuid=True), ForeignKey('files.id', ondelete='CASCADE'), nullable=False)
     size = Column(sa.Enum(ThumbnailSize), nullable=False)
@@ -398,6 +402,7 @@ class FileShare(BaseModel, TimestampMixin):
     File sharing with external users or public links.
     """
     __tablename__ = 'file_shares'
+    __category__ = 'storage_files'
 
     file_id = Column(UUID(as_uuid=True), ForeignKey('files.id', ondelete='CASCADE'), nullable=False)
     share_token = Column(String(100), nullable=False, unique=True, comment="Unique share token")
@@ -478,6 +483,7 @@ class Document(EnhancedBaseModel, VersionMixin, TimestampMixin):
     Document management for structured document handling.
     """
     __tablename__ = 'documents'
+    __category__ = 'storage_files'
 
     # Document identification
     title = Column(String(500), nullable=False)
@@ -551,6 +557,7 @@ class DocumentAttachment(BaseModel):
     Attachments linked to documents.
     """
     __tablename__ = 'document_attachments'
+    __category__ = 'storage_files'
 
     document_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=False)
     file_id = Column(UUID(as_uuid=True), ForeignKey('files.id', ondelete='CASCADE'), nullable=False)
@@ -575,6 +582,7 @@ class DocumentAnnotation(BaseModel, TimestampMixin):
     Annotations and comments on documents.
     """
     __tablename__ = 'document_annotations'
+    __category__ = 'storage_files'
 
     document_id = Column(UUID(as_uuid=True), ForeignKey('documents.id', ondelete='CASCADE'), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
@@ -611,6 +619,7 @@ class MediaCollection(NamedEntityModel):
     Collections for organizing media files.
     """
     __tablename__ = 'media_collections'
+    __category__ = 'storage_files'
 
     collection_type = Column(String(50), default='album', nullable=False)  # album, gallery, playlist
     owner_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
@@ -646,6 +655,7 @@ class MediaCollectionItem(BaseModel, TimestampMixin):
     Items in media collections.
     """
     __tablename__ = 'media_collection_items'
+    __category__ = 'storage_files'
 
     collection_id = Column(UUID(as_uuid=True), ForeignKey('media_collections.id', ondelete='CASCADE'), nullable=False)
     file_id = Column(UUID(as_uuid=True), ForeignKey('files.id', ondelete='CASCADE'), nullable=False)
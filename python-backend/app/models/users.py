@@ -90,6 +90,7 @@ class Organization(NamedEntityModel):
     Each organization is a separate tenant with its own users, roles, etc.
     """
     __tablename__ = 'organizations'
+    __category__ = 'user_auth'
 
     domain = Column(String(255), unique=True, nullable=True, comment="Organization domain")
     logo_url = Column(String(DatabaseConstraints.MAX_URL_LENGTH), nullable=True)
@@ -116,6 +117,7 @@ class Permission(NamedEntityModel):
     Permissions define what actions can be performed on what resources.
     """
     __tablename__ = 'permissions'
+    __category__ = 'user_auth'
 
     category = Column(String(50), nullable=False, comment="Permission category (system, user_management, etc.)")
     resource = Column(String(100), nullable=True, comment="Resource type (users, modules, data, etc.)")
@@ -152,6 +154,7 @@ class Role(NamedEntityModel):
     Roles can inherit from parent roles and have different priority levels.
     """
     __tablename__ = 'roles'
+    __category__ = 'user_auth'
 
     level = Column(Integer, default=99, nullable=False, comment="Role level (lower number = higher priority)")
     parent_id = Column(UUID(as_uuid=True), ForeignKey('roles.id', ondelete='SET NULL'), nullable=True)
@@ -219,6 +222,7 @@ class User(EnhancedBaseModel):
     Supports MFA, session management, preferences, and full audit trail.
     """
     __tablename__ = 'users'
+    __category__ = 'user_auth'
 
     # Basic profile information
     email = Column(String(DatabaseConstraints.MAX_EMAIL_LENGTH), nullable=False)
@@ -474,6 +478,7 @@ class UserPermission(BaseModel, AuditMixin):
     These can grant or deny specific permissions to users.
     """
     __tablename__ = 'user_permission_overrides'
+    __category__ = 'user_auth'
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     permission_id = Column(UUID(as_uuid=True), ForeignKey('permissions.id', ondelete='CASCADE'), nullable=False)
@@ -505,6 +510,7 @@ class Group(NamedEntityModel):
     Users can belong to multiple groups, and groups can have permissions.
     """
     __tablename__ = 'groups'
+    __category__ = 'user_auth'
 
     organization_id = Column(UUID(as_uuid=True), ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False)
     parent_group_id = Column(UUID(as_uuid=True), ForeignKey('groups.id', ondelete='SET NULL'), nullable=True)
@@ -529,6 +535,7 @@ class GroupMember(BaseModel, AuditMixin):
     Group membership with roles within the group.
     """
     __tablename__ = 'group_members'
+    __category__ = 'user_auth'
 
     group_id = Column(UUID(as_uuid=True), ForeignKey('groups.id', ondelete='CASCADE'), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
@@ -553,6 +560,7 @@ class GroupPermission(BaseModel, AuditMixin):
     Permissions assigned to groups.
     """
     __tablename__ = 'group_permissions'
+    __category__ = 'user_auth'
 
     group_id = Column(UUID(as_uuid=True), ForeignKey('groups.id', ondelete='CASCADE'), nullable=False)
     permission_id = Column(UUID(as_uuid=True), ForeignKey('permissions.id', ondelete='CASCADE'), nullable=False)
@@ -575,6 +583,7 @@ class UserSession(BaseModel):
     Supports token families for refresh token rotation.
     """
     __tablename__ = 'user_sessions'
+    __category__ = 'user_auth'
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     token_family = Column(UUID(as_uuid=True), nullable=False, comment="All refresh tokens from same login")
@@ -616,6 +625,7 @@ class LoginAttempt(BaseModel):
     Login attempt tracking for security monitoring.
     """
     __tablename__ = 'login_attempts'
+    __category__ = 'user_auth'
 
     email = Column(String(DatabaseConstraints.MAX_EMAIL_LENGTH), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
@@ -644,6 +654,7 @@ class AuditLog(BaseModel):
     Comprehensive audit log for tracking all system changes.
     """
     __tablename__ = 'audit_logs'
+    __category__ = 'user_auth'
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
     organization_id = Column(UUID(as_uuid=True), ForeignKey('organizations.id', ondelete='CASCADE'), nullable=True)
@@ -0,0 +1,140 @@
+"""
+Unit tests for the base model helpers.
+
+Tests BaseModel bulk helpers together with VersionMixin optimistic locking,
+and SlugMixin slug generation.
+"""
+
+import uuid
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import BaseModel, SlugMixin, VersionMixin
+
+
+class IsolatedBase(DeclarativeBase):
+    """Separate registry so the test model never configures the app's mappers."""
+
+
+class VersionedRecord(IsolatedBase, VersionMixin):
+    """Minimal versioned model exercising BaseModel's bulk helpers."""
+    __tablename__ = 'test_versioned_records'
+
+    id: Mapped[uuid.UUID] = mapped_column(sa.Uuid, primary_key=True, default=uuid.uuid4)
+    title: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+
+    bulk_create = BaseModel.__dict__['bulk_create']
+    bulk_update = BaseModel.__dict__['bulk_update']
+
+
+@pytest.fixture
+def session():
+    """Sync SQLite session with only the test table created."""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    VersionedRecord.__table__.create(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+class TestVersionedBulkHelpers:
+    """Test bulk_create/bulk_update on a VersionMixin model."""
+
+    def test_bulk_create_starts_at_version_one(self, session: Session):
+        """Test that bulk-created rows get the initial version."""
+        ids = [uuid.uuid4(), uuid.uuid4()]
+        VersionedRecord.bulk_create(session, [
+            {"id": ids[0], "title": "a"},
+            {"id": ids[1], "title": "b"},
+        ])
+        session.commit()
+
+        versions = session.scalars(sa.select(VersionedRecord.version)).all()
+        assert versions == [1, 1]
+
+    def test_bulk_update_with_version_bumps_it(self, session: Session):
+        """Test that bulk_update matches on and increments the version."""
+        record_id = uuid.uuid4()
+        VersionedRecord.bulk_create(session, [{"id": record_id, "title": "a"}])
+        session.commit()
+
+        VersionedRecord.bulk_update(session, [{"id": record_id, "version": 1, "title": "b"}])
+        session.commit()
+
+        record = session.get(VersionedRecord, record_id)
+        assert record.title == "b"
+        assert record.version == 2
+
+    def test_bulk_update_without_version_raises(self, session: Session):
+        """Test that versioned bulk updates must carry the current version."""
+        record_id = uuid.uuid4()
+        VersionedRecord.bulk_create(session, [{"id": record_id, "title": "a"}])
+        session.commit()
+
+        with pytest.raises(ValueError, match="version"):
+            VersionedRecord.bulk_update(session, [{"id": record_id, "title": "b"}])
+
+    def test_bulk_update_with_stale_version_raises(self, session: Session):
+        """Test that a stale version is rejected instead of overwriting."""
+        record_id = uuid.uuid4()
+        VersionedRecord.bulk_create(session, [{"id": record_id, "title": "a"}])
+        session.commit()
+        VersionedRecord.bulk_update(session, [{"id": record_id, "version": 1, "title": "b"}])
+        session.commit()
+
+        with pytest.raises(StaleDataError):
+            VersionedRecord.bulk_update(session, [{"id": record_id, "version": 1, "title": "c"}])
+
+
+class TestBumpVersion:
+    """Test VersionMixin.bump_version against rows loaded in the session."""
+
+    def test_loaded_row_can_flush_after_bump(self, session: Session):
+        """Test that a loaded instance follows the bumped version."""
+        record = VersionedRecord(title="a")
+        session.add(record)
+        session.commit()
+        assert record.version == 1
+
+        VersionedRecord.bump_version(session, record.id)
+        assert record.version == 2
+
+        record.title = "b"
+        session.flush()
+        session.commit()
+
+        assert record.version == 3
+        assert session.scalar(sa.select(VersionedRecord.title)) == "b"
+
+
+class TestGenerateSlug:
+    """Test SlugMixin.generate_slug."""
+
+    def test_ascii_text(self):
+        """Test that ASCII text is lowercased and hyphenated."""
+        assert SlugMixin.generate_slug("Hello  World!") == "hello-world"
+
+    def test_accents_are_transliterated(self):
+        """Test that accented Latin text becomes plain ASCII."""
+        assert SlugMixin.generate_slug("Gestão de Ações") == "gestao-de-acoes"
+
+    def test_non_latin_text_is_kept(self):
+        """Test that text with no ASCII form does not collapse to empty."""
+        assert SlugMixin.generate_slug("Привет мир") == "привет-мир"
+        assert SlugMixin.generate_slug("日本語") == "日本語"
+
+    def test_no_slug_characters_raises(self):
+        """Test that text without word characters is rejected."""
+        with pytest.raises(ValueError, match="slug"):
+            SlugMixin.generate_slug("---")
+        with pytest.raises(ValueError, match="slug"):
+            SlugMixin.generate_slug("")